@@ -0,0 +1,45 @@
+#!/usr/bin/python
+import os, sys, shutil, subprocess, tempfile
+from PIL import Image
+
+# Times novice.open for each image format and measures how much memory
+# loading takes at its peak, as a multiple of the size of the pixels.
+
+SIZE = (3000, 2250)
+FORMATS = [("png", "RGB"), ("jpg", "RGB"), ("bmp", "RGB"), ("png", "RGBA"),
+           ("png", "L"), ("gif", "P")]
+
+# Run in a fresh interpreter so the peak isn't hidden by earlier loads
+LOAD = """
+import sys, time, resource
+from image_novice import novice
+import numpy, PIL.Image
+
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.time()
+picture = novice.open(sys.argv[1])
+picture._image
+elapsed = time.time() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print("{0} {1}".format(elapsed, (after - before) * 1024))
+"""
+
+if __name__ == "__main__":
+    root = os.path.dirname(os.path.abspath(__file__))
+    source = Image.open(os.path.join(root, "sample.png")).convert("RGB")
+    source = source.resize(SIZE, Image.BILINEAR)
+    image_bytes = SIZE[0] * SIZE[1] * 3
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        for extension, mode in FORMATS:
+            path = os.path.join(tmp_dir, "{0}.{1}".format(mode, extension))
+            source.convert(mode).save(path)
+
+            output = subprocess.check_output([sys.executable, "-c", LOAD, path],
+                                             cwd=root)
+            elapsed, peak = output.split()
+            print("{0:>4} {1:<4} {2:7.1f} ms  peak {3:.2f}x image size".format(
+                extension, mode, float(elapsed) * 1000, float(peak) / image_bytes))
+    finally:
+        shutil.rmtree(tmp_dir)
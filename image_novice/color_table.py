@@ -0,0 +1,3 @@
+# Generated by make_colors.py; do not edit.
+NAMES = 'air force blue raf\nair force blue usaf\nair superiority blue\nalabama crimson\nalice blue\nalizarin crimson\nalloy orange\nalmond\namaranth\namber\namber sae ece\namerican rose\namethyst\nandroid green\nanti flash white\nantique brass\nantique fuchsia\nantique ruby\nantique white\nao english\napple green\napricot\naqua\naquamarine\narmy green\narsenic\narylide yellow\nash grey\nasparagus\natomic tangerine\nauburn\naureolin\naurometalsaurus\navocado\nazure\nazure mist web\nbaby blue\nbaby blue eyes\nbaby pink\nball blue\nbanana mania\nbanana yellow\nbarn red\nbattleship grey\nbazaar\nbeau blue\nbeaver\nbeige\nbig dip o ruby\nbisque\nbistre\nbittersweet\nbittersweet shimmer\nblack\nblack bean\nblack leather jacket\nblack olive\nblanched almond\nblast off bronze\nbleu de france\nblizzard blue\nblond\nblue\nblue bell\nblue crayola\nblue gray\nblue green\nblue munsell\nblue ncs\nblue pigment\nblue ryb\nblue sapphire\nblue violet\nblush\nbole\nbondi blue\nbone\nboston university red\nbottle green\nboysenberry\nbrandeis blue\nbrass\nbrick red\nbright cerulean\nbright green\nbright lavender\nbright maroon\nbright pink\nbright turquoise\nbright ube\nbrilliant lavender\nbrilliant rose\nbrink pink\nbritish racing green\nbronze\nbrown traditional\nbrown web\nbubble gum\nbubbles\nbuff\nbulgarian rose\nburgundy\nburlywood\nburnt orange\nburnt sienna\nburnt umber\nbyzantine\nbyzantium\ncadet\ncadet blue\ncadet grey\ncadmium green\ncadmium orange\ncadmium red\ncadmium yellow\ncaf au lait\ncaf noir\ncal poly green\ncambridge blue\ncamel\ncameo pink\ncamouflage green\ncanary yellow\ncandy apple red\ncandy pink\ncapri\ncaput mortuum\ncardinal\ncaribbean green\ncarmine\ncarmine m p\ncarmine pink\ncarmine red\ncarnation pink\ncarnelian\ncarolina blue\ncarrot orange\ncatalina blue\nceil\nceladon\nceladon blue\nceladon green\nceleste colour\ncelestial blue\ncerise\ncerise pink\ncerulean\ncerulean blue\ncerulean frost\ncg blue\ncg red\nchamoisee\nchampagne\ncharcoal\ncharm pink\nchartreuse traditional\nchartreuse web\ncherry\ncherry blossom pink\nchestnut\nchina pink\nchina rose\nchinese red\nchocolate traditional\nchocolate web\nchrome yellow\ncinereous\ncinnabar\ncinnamon\ncitrine\nclassic rose\ncobalt\ncocoa brown\ncoffee\ncolumbia blue\ncongo pink\ncool black\ncool grey\ncopper\ncopper crayola\ncopper penny\ncopper red\ncopper rose\ncoquelicot\ncoral\ncoral pink\ncoral red\ncordovan\ncorn\ncornell red\ncornflower blue\ncornsilk\ncosmic latte\ncotton candy\ncream\ncrimson\ncrimson glory\ncyan\ncyan process\ndaffodil\ndandelion\ndark blue\ndark brown\ndark byzantium\ndark candy apple red\ndark cerulean\ndark chestnut\ndark coral\ndark cyan\ndark electric blue\ndark goldenrod\ndark gray\ndark green\ndark imperial blue\ndark jungle green\ndark khaki\ndark lava\ndark lavender\ndark magenta\ndark midnight blue\ndark olive green\ndark orange\ndark orchid\ndark pastel blue\ndark pastel green\ndark pastel purple\ndark pastel red\ndark pink\ndark powder blue\ndark raspberry\ndark red\ndark salmon\ndark scarlet\ndark sea green\ndark sienna\ndark slate blue\ndark slate gray\ndark spring green\ndark tan\ndark tangerine\ndark taupe\ndark terra cotta\ndark turquoise\ndark violet\ndark yellow\ndartmouth green\ndavy s grey\ndebian red\ndeep carmine\ndeep carmine pink\ndeep carrot orange\ndeep cerise\ndeep champagne\ndeep chestnut\ndeep coffee\ndeep fuchsia\ndeep jungle green\ndeep lilac\ndeep magenta\ndeep peach\ndeep pink\ndeep ruby\ndeep saffron\ndeep sky blue\ndeep tuscan red\ndenim\ndesert\ndesert sand\ndim gray\ndodger blue\ndogwood rose\ndollar bill\ndrab\nduke blue\nearth yellow\nebony\necru\neggplant\neggshell\negyptian blue\nelectric blue\nelectric crimson\nelectric cyan\nelectric green\nelectric indigo\nelectric lavender\nelectric lime\nelectric purple\nelectric ultramarine\nelectric violet\nelectric yellow\nemerald\nenglish lavender\neton blue\nfallow\nfalu red\nfandango\nfashion fuchsia\nfawn\nfeldgrau\nfern green\nferrari red\nfield drab\nfire engine red\nfirebrick\nflame\nflamingo pink\nflavescent\nflax\nfloral white\nfluorescent orange\nfluorescent pink\nfluorescent yellow\nfolly\nforest green traditional\nforest green web\nfrench beige\nfrench blue\nfrench lilac\nfrench lime\nfrench raspberry\nfrench rose\nfuchsia\nfuchsia crayola\nfuchsia pink\nfuchsia rose\nfulvous\nfuzzy wuzzy\ngainsboro\ngamboge\nghost white\nginger\nglaucous\nglitter\ngold metallic\ngold web golden\ngolden brown\ngolden poppy\ngolden yellow\ngoldenrod\ngranny smith apple\ngray\ngray asparagus\ngray html css gray\ngray x11 gray\ngreen\ngreen crayola\ngreen html css green\ngreen munsell\ngreen ncs\ngreen pigment\ngreen ryb\ngreen yellow\ngrullo\nguppie green\nhalay be\nhan blue\nhan purple\nhansa yellow\nharlequin\nharvard crimson\nharvest gold\nheart gold\nheliotrope\nhollywood cerise\nhoneydew\nhonolulu blue\nhooker s green\nhot magenta\nhot pink\nhunter green\niceberg\nicterine\nimperial blue\ninchworm\nindia green\nindian red\nindian yellow\nindigo\nindigo dye\nindigo web\ninternational klein blue\ninternational orange aerospace\ninternational orange engineering\ninternational orange golden gate bridge\niris\nisabelline\nislamic green\nivory\njade\njasmine\njasper\njazzberry jam\njet\njonquil\njune bud\njungle green\nkelly green\nkenyan copper\nkhaki html css khaki\nkhaki x11 light khaki\nku crimson\nla salle green\nlanguid lavender\nlapis lazuli\nlaser lemon\nlaurel green\nlava\nlavender blue\nlavender blush\nlavender floral\nlavender gray\nlavender indigo\nlavender magenta\nlavender mist\nlavender pink\nlavender purple\nlavender rose\nlavender web\nlawn green\nlemon\nlemon chiffon\nlemon lime\nlicorice\nlight apricot\nlight blue\nlight brown\nlight carmine pink\nlight coral\nlight cornflower blue\nlight crimson\nlight cyan\nlight fuchsia pink\nlight goldenrod yellow\nlight gray\nlight green\nlight khaki\nlight pastel purple\nlight pink\nlight red ochre\nlight salmon\nlight salmon pink\nlight sea green\nlight sky blue\nlight slate gray\nlight taupe\nlight thulian pink\nlight yellow\nlilac\nlime\nlime green\nlime web x11 green\nlimerick\nlincoln green\nlinen\nlion\nlittle boy blue\nliver\nlust\nmagenta\nmagenta dye\nmagenta process\nmagic mint\nmagnolia\nmahogany\nmaize\nmajorelle blue\nmalachite\nmanatee\nmango tango\nmantis\nmardi gras\nmaroon crayola\nmaroon html css\nmaroon x11\nmauve\nmauve taupe\nmauvelous\nmaya blue\nmeat brown\nmedium aquamarine\nmedium blue\nmedium candy apple red\nmedium carmine\nmedium champagne\nmedium electric blue\nmedium jungle green\nmedium lavender magenta\nmedium orchid\nmedium persian blue\nmedium purple\nmedium red violet\nmedium ruby\nmedium sea green\nmedium slate blue\nmedium spring bud\nmedium spring green\nmedium taupe\nmedium turquoise\nmedium tuscan red\nmedium vermilion\nmedium violet red\nmellow apricot\nmellow yellow\nmelon\nmidnight blue\nmidnight green eagle green\nmikado yellow\nmint\nmint cream\nmint green\nmisty rose\nmoccasin\nmode beige\nmoonstone blue\nmordant red 19\nmoss green\nmountain meadow\nmountbatten pink\nmsu green\nmulberry\nmustard\nmyrtle\nnadeshiko pink\nnapier green\nnaples yellow\nnavajo white\nnavy blue\nneon carrot\nneon fuchsia\nneon green\nnew york pink\nnon photo blue\nnorth texas green\nocean boat blue\nochre\noffice green\nold gold\nold lace\nold lavender\nold mauve\nold rose\nolive\nolive drab 7\nolive drab web olive drab 3\nolivine\nonyx\nopera mauve\norange\norange peel\norange red\norange ryb\norange web color\norchid\notter brown\nou crimson red\nouter space\noutrageous orange\noxford blue\npakistan green\npalatinate blue\npalatinate purple\npale aqua\npale blue\npale brown\npale carmine\npale cerulean\npale chestnut\npale copper\npale cornflower blue\npale gold\npale goldenrod\npale green\npale lavender\npale magenta\npale pink\npale plum\npale red violet\npale robin egg blue\npale silver\npale spring bud\npale taupe\npale violet red\npansy purple\npapaya whip\nparis green\npastel blue\npastel brown\npastel gray\npastel green\npastel magenta\npastel orange\npastel pink\npastel purple\npastel red\npastel violet\npastel yellow\npatriarch\npayne s grey\npeach\npeach crayola\npeach orange\npeach puff\npeach yellow\npear\npearl\npearl aqua\npearly purple\nperidot\nperiwinkle\npersian blue\npersian green\npersian indigo\npersian orange\npersian pink\npersian plum\npersian red\npersian rose\npersimmon\nperu\nphlox\nphthalo blue\nphthalo green\npiggy pink\npine green\npink\npink lace\npink orange\npink pearl\npink sherbet\npistachio\nplatinum\nplum traditional\nplum web\nportland orange\npowder blue web\nprinceton orange\nprune\nprussian blue\npsychedelic purple\npuce\npumpkin\npurple heart\npurple html css\npurple mountain majesty\npurple munsell\npurple pizzazz\npurple taupe\npurple x11\nquartz\nrackley\nradical red\nrajah\nraspberry\nraspberry glace\nraspberry pink\nraspberry rose\nraw umber\nrazzle dazzle rose\nrazzmatazz\nred\nred brown\nred devil\nred munsell\nred ncs\nred orange\nred pigment\nred ryb\nred violet\nredwood\nregalia\nresolution blue\nrich black\nrich brilliant lavender\nrich carmine\nrich electric blue\nrich lavender\nrich lilac\nrich maroon\nrifle green\nrobin egg blue\nrose\nrose bonbon\nrose ebony\nrose gold\nrose madder\nrose pink\nrose quartz\nrose taupe\nrose vale\nrosewood\nrosso corsa\nrosy brown\nroyal azure\nroyal blue traditional\nroyal blue web\nroyal fuchsia\nroyal purple\nroyal yellow\nrubine red\nruby\nruby red\nruddy\nruddy brown\nruddy pink\nrufous\nrusset\nrust\nrusty red\nsacramento state green\nsaddle brown\nsafety orange blaze orange\nsaffron\nsalmon\nsalmon pink\nsand\nsand dune\nsandstorm\nsandy brown\nsandy taupe\nsangria\nsap green\nsapphire\nsapphire blue\nsatin sheen gold\nscarlet\nscarlet crayola\nschool bus yellow\nscreamin green\nsea blue\nsea green\nseal brown\nseashell\nselective yellow\nsepia\nshadow\nshamrock green\nshocking pink\nshocking pink crayola\nsienna\nsilver\nsinopia\nskobeloff\nsky blue\nsky magenta\nslate blue\nslate gray\nsmalt dark powder blue\nsmokey topaz\nsmoky black\nsnow\nspiro disco ball\nspring bud\nspring green\nst patrick s blue\nsteel blue\nstil de grain yellow\nstizza\nstormcloud\nstraw\nsunglow\nsunset\ntan\ntangelo\ntangerine\ntangerine yellow\ntango pink\ntaupe\ntaupe gray\ntea green\ntea rose orange\ntea rose rose\nteal\nteal blue\nteal green\ntelemagenta\ntenn tawny\nterra cotta\nthistle\nthulian pink\ntickle me pink\ntiffany blue\ntiger s eye\ntimberwolf\ntitanium yellow\ntomato\ntoolbox\ntopaz\ntractor red\ntrolley grey\ntropical rain forest\ntrue blue\ntufts blue\ntumbleweed\nturkish rose\nturquoise\nturquoise blue\nturquoise green\ntuscan red\ntwilight lavender\ntyrian purple\nua blue\nua red\nube\nucla blue\nucla gold\nufo green\nultra pink\nultramarine\nultramarine blue\number\nunbleached silk\nunited nations blue\nuniversity of california gold\nunmellow yellow\nup forest green\nup maroon\nupsdell red\nurobilin\nusafa blue\nusc cardinal\nusc gold\nutah crimson\nvanilla\nvegas gold\nvenetian red\nverdigris\nvermilion cinnabar\nvermilion plochere\nveronica\nviolet\nviolet blue\nviolet color wheel\nviolet ryb\nviolet web\nviridian\nvivid auburn\nvivid burgundy\nvivid cerise\nvivid tangerine\nvivid violet\nwarm black\nwaterspout\nwenge\nwheat\nwhite\nwhite smoke\nwild blue yonder\nwild strawberry\nwild watermelon\nwine\nwine dregs\nwisteria\nwood brown\nxanadu\nyale blue\nyellow\nyellow green\nyellow munsell\nyellow ncs\nyellow orange\nyellow process\nyellow ryb\nzaffre\nzinnwaldite brown'
+RGB = b']\x8a\xa8\x000\x8fr\xa0\xc1\xa3&8\xf0\xf8\xff\xe3&6\xc4b\x10\xef\xde\xcd\xe5+P\xff\xbf\x00\xff~\x00\xff\x03>\x99f\xcc\xa4\xc69\xf2\xf3\xf4\xcd\x95u\x91\\\x83\x84\x1b-\xfa\xeb\xd7\x00\x80\x00\x8d\xb6\x00\xfb\xce\xb1\x00\xff\xff\x7f\xff\xd4KS ;DK\xe9\xd6k\xb2\xbe\xb5\x87\xa9k\xff\x99f\xa5**\xfd\xee\x00n\x7f\x80V\x82\x03\x00\x7f\xff\xf0\xff\xff\x89\xcf\xf0\xa1\xca\xf1\xf4\xc2\xc2!\xab\xcd\xfa\xe7\xb5\xff\xe15|\n\x02\x84\x84\x82\x98w{\xbc\xd4\xe6\x9f\x81p\xf5\xf5\xdc\x9c%B\xff\xe4\xc4=+\x1f\xfeo^\xbfOQ\x00\x00\x00=\x0c\x02%5);<6\xff\xeb\xcd\xa5qd1\x8c\xe7\xac\xe5\xee\xfa\xf0\xbe\x00\x00\xff\xa2\xa2\xd0\x1fu\xfef\x99\xcc\r\x98\xba\x00\x93\xaf\x00\x87\xbd33\x99\x02G\xfe\x12a\x80\x8a+\xe2\xde]\x83yD;\x00\x95\xb6\xe3\xda\xc9\xcc\x00\x00\x00jN\x872`\x00p\xff\xb5\xa6B\xcbAT\x1d\xac\xd6f\xff\x00\xbf\x94\xe4\xc3!H\xff\x00\x7f\x08\xe8\xde\xd1\x9f\xe8\xf4\xbb\xff\xffU\xa3\xfb`\x7f\x00B%\xcd\x7f2\x96K\x00\xa5**\xff\xc1\xcc\xe7\xfe\xff\xf0\xdc\x82H\x06\x07\x80\x00 \xde\xb8\x87\xccU\x00\xe9tQ\x8a3$\xbd3\xa4p)cShr_\x9e\xa0\x91\xa3\xb0\x00k<\xed\x87-\xe3\x00"\xff\xf6\x00\xa6{[K6!\x1eM+\xa3\xc1\xad\xc1\x9ak\xef\xbb\xccx\x86k\xff\xef\x00\xff\x08\x00\xe4qz\x00\xbf\xffY\' \xc4\x1e:\x00\xcc\x99\x96\x00\x18\xd7\x00@\xebLB\xff\x008\xff\xa6\xc9\xb3\x1b\x1b\x99\xba\xdd\xed\x91!\x06*x\x92\xa1\xcf\xac\xe1\xaf\x00{\xa7/\x84|\xb2\xff\xffI\x97\xd0\xde1c\xec;\x83\x00{\xa7*R\xbem\x9b\xc3\x00z\xa5\xe0<1\xa0xZ\xfa\xd6\xa56EO\xe6\x8f\xac\xdf\xff\x00\x7f\xff\x00\xde1c\xff\xb7\xc5\xcd\\\\\xdeo\xa1\xa8Qn\xaa8\x1e{?\x00\xd2i\x1e\xff\xa7\x00\x98\x81{\xe3B4\xd2i\x1e\xe4\xd0\n\xfb\xcc\xe7\x00G\xab\xd2i\x1eoN7\x9b\xdd\xff\xf8\x83y\x00.c\x8c\x92\xac\xb8s3\xda\x8ag\xadoi\xcbmQ\x99ff\xff8\x00\xff\x7fP\xf8\x83y\xff@@\x89?E\xfb\xec]\xb3\x1b\x1bd\x95\xed\xff\xf8\xdc\xff\xf8\xe7\xff\xbc\xd9\xff\xfd\xd0\xdc\x14<\xbe\x002\x00\xff\xff\x00\xb7\xeb\xff\xff1\xf0\xe10\x00\x00\x8beC!]9T\xa4\x00\x00\x08E~\x98i`\xcd[E\x00\x8b\x8bShx\xb8\x86\x0b\xa9\xa9\xa9\x012 \x00Aj\x1a$!\xbd\xb7kH<2sO\x96\x8b\x00\x8b\x003fUk/\xff\x8c\x00\x992\xccw\x9e\xcb\x03\xc0<\x96o\xd6\xc2;"\xe7T\x80\x003\x99\x87&W\x8b\x00\x00\xe9\x96zV\x03\x19\x8f\xbc\x8f<\x14\x14H=\x8b/OO\x17rE\x91\x81Q\xff\xa8\x12H<2\xccN\\\x00\xce\xd1\x94\x00\xd3\x9b\x87\x0c\x00p<UUU\xd7\nS\xa9 >\xef08\xe9i,\xda2\x87\xfa\xd6\xa5\xb9NHpBA\xc1T\xc1\x00KI\x99U\xbb\xcc\x00\xcc\xff\xcb\xa4\xff\x14\x93\x84?[\xff\x993\x00\xbf\xfffBM\x15`\xbd\xc1\x9ak\xed\xc9\xafiii\x1e\x90\xff\xd7\x18h\x85\xbbe\x96q\x17\x00\x00\x9c\xe1\xa9_U]P\xc2\xb2\x80a@Q\xf0\xea\xd6\x104\xa6}\xf9\xff\xff\x00?\x00\xff\xff\x00\xff\x00o\x00\xff\xf4\xbb\xff\xcc\xff\x00\xbf\x00\xff?\x00\xff\x8f\x00\xff\xff\xff\x00P\xc8x\xb4\x83\x95\x96\xc8\xa2\xc1\x9ak\x80\x18\x18\xb53\x89\xf4\x00\xa1\xe5\xaapM]SOyB\xff(\x00lT\x1e\xce )\xb2""\xe2X"\xfc\x8e\xac\xf7\xe9\x8e\xee\xdc\x82\xff\xfa\xf0\xff\xbf\x00\xff\x14\x93\xcc\xff\x00\xff\x00O\x01D!"\x8b"\xa6{[\x00r\xbb\x86`\x8e\xcc\xff\x00\xc7,H\xf6J\x8a\xff\x00\xff\xc1T\xc1\xffw\xff\xc7Cu\xe4\x84\x00\xccff\xdc\xdc\xdc\xe4\x9b\x0f\xf8\xf8\xff\xb0e\x00`\x82\xb6\xe6\xe8\xfa\xd4\xaf7\xff\xd7\x00\x99e\x15\xfc\xc2\x00\xff\xdf\x00\xda\xa5 \xa8\xe4\xa0\x80\x80\x80FYE\x80\x80\x80\xbe\xbe\xbe\x00\xff\x00\x1c\xacx\x00\x80\x00\x00\xa8w\x00\x9fk\x00\xa5Pf\xb02\xad\xff/\xa9\x9a\x86\x00\xff\x7ff8TDl\xcfR\x18\xfa\xe9\xd6k?\xff\x00\xc9\x00\x16\xda\x91\x00\x80\x80\x00\xdfs\xff\xf4\x00\xa1\xf0\xff\xf0\x00\x7f\xbfIyk\xff\x1d\xce\xffi\xb45^;q\xa6\xd2\xfc\xf7^\x00#\x95\xb2\xec]\x13\x88\x08\xcd\\\\\xe3\xa8Wo\x00\xff\x00AjK\x00\x82\x00/\xa7\xffO\x00\xba\x16\x0c\xc06,ZO\xcf\xf4\xf0\xec\x00\x90\x00\xff\xff\xf0\x00\xa8k\xf8\xde~\xd7;>\xa5\x0b^444\xfa\xda^\xbd\xdaW)\xab\x87L\xbb\x17|\x1c\x05\xc3\xb0\x91\xf0\xe6\x8c\xe8\x00\r\x08x0\xd6\xca\xdd&a\x9c\xfe\xfe"\xa9\xba\x9d\xcf\x10 \xcc\xcc\xff\xff\xf0\xf5\xb5~\xdc\xc4\xc3\xd0\x94W\xeb\xee\x82\xee\xe6\xe6\xfa\xfb\xae\xd2\x96{\xb6\xfb\xa0\xe3\xe6\xe6\xfa|\xfc\x00\xff\xf7\x00\xff\xfa\xcd\xe3\xff\x00\x1a\x11\x10\xfd\xd5\xb1\xad\xd8\xe6\xb5e\x1d\xe6gq\xf0\x80\x80\x93\xcc\xea\xf5i\x91\xe0\xff\xff\xf9\x84\xef\xfa\xfa\xd2\xd3\xd3\xd3\x90\xee\x90\xf0\xe6\x8c\xb1\x9c\xd9\xff\xb6\xc1\xe9tQ\xff\xa0z\xff\x99\x99 \xb2\xaa\x87\xce\xfaw\x88\x99\xb3\x8bm\xe6\x8f\xac\xff\xff\xe0\xc8\xa2\xc8\xbf\xff\x002\xcd2\x00\xff\x00\x9d\xc2\t\x19Y\x05\xfa\xf0\xe6\xc1\x9akl\xa0\xdcSKO\xe6  \xff\x00\xff\xca\x1f{\xff\x00\x90\xaa\xf0\xd1\xf8\xf4\xff\xc0@\x00\xfb\xec]`P\xdc\x0b\xdaQ\x97\x9a\xaa\xff\x82Ct\xc3e\x88\x00\x85\xc3!H\x80\x00\x00\xb00`\xe0\xb0\xff\x91_m\xef\x98\xaas\xc2\xfb\xe5\xb7;f\xdd\xaa\x00\x00\xcd\xe2\x06,\xaf@5\xf3\xe5\xab\x03P\x96\x1c5-\xdd\xa0\xdd\xbaU\xd3\x00g\xa5\x93p\xdb\xbb3\x85\xaa@i<\xb3q{h\xee\xc9\xdc\x87\x00\xfa\x9agLGH\xd1\xccyD;\xd9`;\xc7\x15\x85\xf8\xb8x\xf8\xde~\xfd\xbc\xb4\x19\x19p\x00IS\xff\xc4\x0c>\xb4\x89\xf5\xff\xfa\x98\xff\x98\xff\xe4\xe1\xfa\xeb\xd7\x96q\x17s\xa9\xc2\xae\x0c\x00\xad\xdf\xad0\xba\x8f\x99z\x8d\x18E;\xc5K\x8c\xff\xdbX!B\x1e\xf6\xad\xc6*\x80\x00\xfa\xda^\xff\xde\xad\x00\x00\x80\xff\xa3C\xfeAd9\xff\x14\xd7\x83\x7f\xa4\xdd\xed\x05\x903\x00w\xbe\xccw"\x00\x80\x00\xcf\xb5;\xfd\xf5\xe6yhxg1G\xc0\x80\x81\x80\x80\x00<4\x1fk\x8e#\x9a\xb9s589\xb7\x84\xa7\xff\x7f\x00\xff\x9f\x00\xffE\x00\xfb\x99\x02\xff\xa5\x00\xdap\xd6eC!\x99\x00\x00AJL\xffnJ\x00!G\x00f\x00\';\xe2h(`\xbc\xd4\xe6\xaf\xee\xee\x98vT\xaf@5\x9b\xc4\xe2\xdd\xad\xaf\xda\x8ag\xab\xcd\xef\xe6\xbe\x8a\xee\xe8\xaa\x98\xfb\x98\xdc\xd0\xff\xf9\x84\xe5\xfa\xda\xdd\xdd\xa0\xdd\xdbp\x93\x96\xde\xd1\xc9\xc0\xbb\xec\xeb\xbd\xbc\x98~\xdbp\x93x\x18J\xff\xef\xd5P\xc8x\xae\xc6\xcf\x83iS\xcf\xcf\xc4w\xddw\xf4\x9a\xc2\xff\xb3G\xde\xa5\xa4\xb3\x9e\xb5\xffia\xcb\x99\xc9\xfd\xfd\x96\x80\x00\x80Shx\xff\xe5\xb4\xff\xcb\xa4\xff\xcc\x99\xff\xda\xb9\xfa\xdf\xad\xd1\xe21\xea\xe0\xc8\x88\xd8\xc0\xb7h\xa2\xe6\xe2\x00\xcc\xcc\xff\x1c9\xbb\x00\xa6\x932\x12z\xd9\x90X\xf7\x7f\xbep\x1c\x1c\xcc33\xfe(\xa2\xecX\x00\xcd\x85?\xdf\x00\xff\x00\x0f\x89\x125$\xfd\xdd\xe6\x01yo\xff\xc0\xcb\xff\xdd\xf4\xff\x99f\xe7\xac\xcf\xf7\x8f\xa7\x93\xc5r\xe5\xe4\xe2\x8eE\x85\xdd\xa0\xdd\xffZ6\xb0\xe0\xe6\xff\x8f\x00p\x1c\x1c\x001S\xdf\x00\xff\xcc\x88\x99\xffu\x18i5\x9c\x80\x00\x80\x96x\xb6\x9f\x00\xc5\xfeN\xdaP@M\xa0 \xf0QHO]\x8a\xa8\xff5^\xfb\xab`\xe3\x0b]\x91_m\xe2P\x98\xb3Dl\x82fD\xff3\xcc\xe3%k\xff\x00\x00\xa5**\x86\x01\x11\xf2\x00<\xc4\x023\xffSI\xed\x1c$\xfe\'\x12\xc7\x15\x85\xabNRR-\x80\x00#\x87\x00@@\xf1\xa7\xfe\xd7\x00@\x08\x92\xd0\xa7k\xcf\xb6f\xd2\xb00`AH3\x00\xcc\xcc\xff\x00\x7f\xf9B\x9egHF\xb7ny\xe3&6\xfff\xcc\xaa\x98\xa9\x90]]\xabNRe\x00\x0b\xd4\x00\x00\xbc\x8f\x8f\x008\xa8\x00#fAi\xe1\xca,\x92xQ\xa9\xfa\xda^\xd1\x00V\xe0\x11_\x9b\x11\x1e\xff\x00(\xbbe(\xe1\x8e\x96\xa8\x1c\x07\x80F\x1b\xb7A\x0e\xda,C\x00V?\x8bE\x13\xffg\x00\xf4\xc40\xff\x8ci\xff\x91\xa4\xc2\xb2\x80\x96q\x17\xec\xd5@\xf4\xa4`\x96q\x17\x92\x00\nP}*\x0fR\xba\x00g\xa5\xcb\xa15\xff$\x00\xfd\x0e5\xff\xd8\x00v\xffz\x00i\x94.\x8bW2\x14\x14\xff\xf5\xee\xff\xba\x00pB\x14\x8ay]\x00\x9e`\xfc\x0f\xc0\xffo\xff\x88-\x17\xc0\xc0\xc0\xcbA\x0b\x00tt\x87\xce\xeb\xcfq\xafjZ\xcdp\x80\x90\x003\x99\x93=A\x10\x0c\x08\xff\xfa\xfa\x0f\xc0\xfc\xa7\xfc\x00\x00\xff\x7f#)zF\x82\xb4\xfa\xda^\x99\x00\x00Ofj\xe4\xd9o\xff\xcc3\xfa\xd6\xa5\xd2\xb4\x8c\xf9M\x00\xf2\x85\x00\xff\xcc\x00\xe4qzH<2\x8b\x85\x89\xd0\xf0\xc0\xf8\x83y\xf4\xc2\xc2\x00\x80\x806u\x88\x00\x82\x7f\xcf4v\xcdW\x00\xe2r[\xd8\xbf\xd8\xdeo\xa1\xfc\x89\xac\n\xba\xb5\xe0\x8d<\xdb\xd7\xd2\xee\xe6\x00\xffcGtl\xc0\xff\xc8|\xfd\x0e5\x80\x80\x80\x00u^\x00s\xcfA}\xc1\xde\xaa\x88\xb5r\x810\xd5\xc8\x00\xff\xef\xa0\xd6\xb4|HH\x8aIkf\x02<\x003\xaa\xd9\x00L\x88x\xc3Sh\x95\xff\xb3\x00<\xd0p\xffo\xff\x12\n\x8fAf\xf5cQG\xff\xdd\xca[\x92\xe5\xb7\x87\'\xff\xfff\x01D!{\x11\x13\xae )\xe1\xad!\x00O\x98\x99\x00\x00\xff\xcc\x00\xd3\x00?\xf3\xe5\xab\xc5\xb3X\xc8\x08\x15C\xb3\xae\xe3B4\xd9`;\xa0 \xf0\x8f\x00\xff2J\xb2\x7f\x00\xff\x86\x01\xaf\xee\x82\xee@\x82m\x92\'$\x9f\x1d5\xda\x1d\x81\xff\xa0\x89\x9f\x00\xff\x00BB\xa4\xf4\xf9dTR\xf5\xde\xb3\xff\xff\xff\xf5\xf5\xf5\xa2\xad\xd0\xffC\xa4\xfcl\x85r/7g1G\xc9\xa0\xdc\xc1\x9aks\x86x\x0fM\x92\xff\xff\x00\x9a\xcd2\xef\xcc\x00\xff\xd3\x00\xff\xaeB\xff\xef\x00\xfe\xfe3\x00\x14\xa8,\x16\x08'
@@ -2,7 +2,8 @@
 import argparse, csv
 
 # Imports color names from a CSV file (colors.csv) and outputs a Python file
-# with color name definitions (colors.py).
+# with color name definitions (colors.py), as well as a packed table of the
+# same colors (color_table.py) that novice loads the first time it needs it.
 
 def download_colors(path):
     import urllib2, re
@@ -40,12 +41,29 @@ def download_colors(path):
 
             writer.writerow((id_name, name, hex_str, str(r), str(g), str(b)))
 
+def write_table(rows, path):
+    # One string of names (lowercase, with spaces) separated by newlines
+    # and one string of packed (r, g, b) bytes in the same order.
+    # Later rows replace earlier rows with the same name.
+    colors = {}
+    for row in rows:
+        colors[row[0].replace("_", " ")] = (int(row[-3]), int(row[-2]), int(row[-1]))
+
+    names = sorted(colors)
+    rgb = "".join(chr(v) for name in names for v in colors[name])
+
+    with open(path, "w") as out_file:
+        out_file.write("# Generated by make_colors.py; do not edit.\n")
+        out_file.write("NAMES = {0!r}\n".format("\n".join(names)))
+        out_file.write("RGB = b{0!r}\n".format(rgb))
+
 # -------------------------------------------------- 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--input", "-i", type=str, default="colors.csv", help="Input file (CSV)")
     parser.add_argument("--output", "-o", type=str, default="colors.py", help="Output file (Python)")
+    parser.add_argument("--table", "-t", type=str, default="color_table.py", help="Output file for the packed table (Python)")
     parser.add_argument("--download", "-d", action="store_true", help="Download from Wikipedia")
     args = parser.parse_args()
 
@@ -53,8 +71,12 @@ if __name__ == "__main__":
         download_colors(args.input)
 
     with open(args.input, "r") as input_file:
-        with open(args.output, "w") as output_file:
-            for row in csv.reader(input_file):
-                name = row[0].upper()
-                rgb = (int(row[-3]), int(row[-2]), int(row[-1]))
-                output_file.write("{0} = {1}\n".format(name, rgb))
+        rows = list(csv.reader(input_file))
+
+    with open(args.output, "w") as output_file:
+        for row in rows:
+            name = row[0].upper()
+            rgb = (int(row[-3]), int(row[-2]), int(row[-1]))
+            output_file.write("{0} = {1}\n".format(name, rgb))
+
+    write_table(rows, args.table)
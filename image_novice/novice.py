@@ -29,7 +29,7 @@ Example
     >>> for pixel in picture:                 # can iterate over pixels
     >>> ... if ((pixel.red > 128) and         # pixels have RGB (values are 0-255)...
     >>> ...     (pixel.x < picture.width)):   # ...and know where they are
-    >>> ...     pixel.red /= 2                # pixel is an alias into the picture
+    >>> ...     pixel.red /= 2                # changes go into the picture
     >>> ...
     >>> print picture.modified                # pictures know if their pixels are dirty
     True
@@ -45,22 +45,101 @@ Example
     False
 """
 
-import os, numpy as np, imghdr
-import colors
-from PIL import Image
+import os, io, struct, zlib, tempfile, numbers, collections, multiprocessing
+import multiprocessing.pool, threading, json, contextlib, importlib, imghdr
+import weakref
 from io import BytesIO
 
-# Create color name dict using the constants defined in colors.py
-color_names = { n.lower().replace("_", " ") : colors.__dict__[n]
-                for n in dir(colors)
-                if not n.startswith("__") }
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+class _LazyModule(object):
+    """
+    Stands in for a module that is only imported the first time one of its
+    attributes is used (and then replaces this object in the module globals),
+    so importing novice stays quick.
+    """
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+np = _LazyModule("numpy", "np")
+Image = _LazyModule("PIL.Image", "Image")
+
+# Size in pixels of the square tiles used to keep track of changes
+TILE_SIZE = 64
+
+# Inflated pictures larger than this many pixels are written out a few
+# rows at a time instead of being inflated all at once (where possible)
+_STREAM_PIXELS = 1 << 24
+
+# Pixels in each block of rows computed at once by channel expressions
+# (see _Expression), small enough for the temporaries to stay in cache
+_BLOCK_PIXELS = 1 << 16
+
+# Threads used for whole-picture operations (see set_threads)
+_threads = { "count": 1, "pool": None }
+
+# How pictures are encoded for display in IPython (see set_display)
+_display = { "format": "png", "compress_level": 1, "quality": 90 }
+
+# Filters that can be used when resizing a picture (see Picture.resize),
+# by their names in PIL.Image
+_resample_filters = { "nearest": "NEAREST", "bilinear": "BILINEAR",
+                      "bicubic": "BICUBIC", "lanczos": "LANCZOS" }
+
+class _ColorNames(collections.Mapping):
+    """
+    Maps color names (lowercase, with spaces) to (r, g, b) tuples.  The
+    colors are kept packed in color_table.py (generated by make_colors.py),
+    which is only loaded the first time a color is looked up.
+    """
+    def __init__(self):
+        self._index = None
+        self._rgb = None
+
+    def _load(self):
+        if self._index is None:
+            import color_table
+            names = color_table.NAMES.split("\n")
+            self._rgb = bytearray(color_table.RGB)
+            self._index = dict(zip(names, xrange(0, 3 * len(names), 3)))
+
+        return self._index
+
+    def __getitem__(self, name):
+        offset = self._load()[name]
+        return tuple(self._rgb[offset:offset + 3])
+
+    def __contains__(self, name):
+        return name in self._load()
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+color_names = _ColorNames()
+
+# Parsed color strings (see _parse_color).  Plain dict gets and sets are
+# atomic, so threads can share it without a lock; it is emptied when full.
+_color_cache = {}
+_COLOR_CACHE_SIZE = 1024
 
 def _parse_color(c):
     """Converts a color name or hex string to an RGB tuple.
 
     Parameters
     ----------
-    c : str or tuple
+    c : str, tuple, list or array
         Color name, hex string (#RRGGBB) or RGB tuple
 
     Returns
@@ -76,38 +155,391 @@ def _parse_color(c):
             msg = "Color tuple must be of the form (r, g, b)"
             raise ValueError(msg)
     elif isinstance(c, str):
-        if c.startswith("#") and len(c) == 7:
-            # #RRGGBB hex string
-            r, g, b = (int(c[i:i+2], base=16)
-                       for i in (1, 3, 5))
-            return (r, g, b)
-        elif c in color_names:
-            # Color name
-            return color_names[c]
-        else:
-            msg = "Expected color name or #RRGGBB, got: {0}"
-            raise ValueError(msg.format(c))
+        # Strings are parsed once and then remembered
+        rgb = _color_cache.get(c)
+        if rgb is None:
+            rgb = _parse_color_string(c)
+            if len(_color_cache) >= _COLOR_CACHE_SIZE:
+                _color_cache.clear()
+
+            _color_cache[c] = rgb
+
+        return rgb
+    elif isinstance(c, (list, np.ndarray)):
+        # RGB list or array
+        return _parse_color(tuple(int(v) for v in c))
     else:
         msg = "Expected tuple or string, got: {0}"
         raise ValueError(msg.format(c))
 
+def _parse_color_string(c):
+    """Converts a color name or #RRGGBB hex string to an RGB tuple"""
+    if c.startswith("#") and len(c) == 7:
+        # #RRGGBB hex string
+        r, g, b = (int(c[i:i+2], base=16)
+                   for i in (1, 3, 5))
+        return (r, g, b)
+    elif c in color_names:
+        # Color name
+        return color_names[c]
+    else:
+        msg = "Expected color name or #RRGGBB, got: {0}"
+        raise ValueError(msg.format(c))
+
+class _ColorIndex(object):
+    """
+    Finds the nearest (by RGB distance) of a palette of named colors for
+    many colors at once.  The RGB cube is split into a grid of cells, each
+    of which keeps every palette color that can be the nearest to some
+    point inside it, so each color is only compared with a few candidates.
+    Ties go to the first color in the palette, just like comparing with
+    every color would.
+    """
+    CELL_SIZE = 16
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.rgb = np.array([color_names[n] for n in self.names], dtype=np.int32)
+
+        # Squared distance along each axis from every palette color to the
+        # nearest and farthest points of each (cells, colors) slab
+        low = np.arange(0, 256, self.CELL_SIZE)[:, np.newaxis]
+        high = low + self.CELL_SIZE - 1
+        near, far = [], []
+        for channel in self.rgb.T:
+            near.append((np.clip(channel, low, high) - channel) ** 2)
+            far.append(np.maximum(channel - low, high - channel) ** 2)
+
+        def cube(axes):
+            return (axes[0][:, np.newaxis, np.newaxis] +
+                    axes[1][np.newaxis, :, np.newaxis] +
+                    axes[2][np.newaxis, np.newaxis, :]).reshape((-1, len(self.names)))
+
+        # A color can only be nearest to a point in a cell if it is closer
+        # to the cell than the farthest point of the cell's best color
+        near, far = cube(near), cube(far)
+        candidates = near <= far.min(axis=1)[:, np.newaxis]
+        counts = candidates.sum(axis=1)
+
+        # Candidates of each cell in palette order, padded with the first
+        order = np.argsort(~candidates, axis=1, kind="mergesort")
+        self.table = order[:, :counts.max()]
+        padding = np.arange(self.table.shape[1]) >= counts[:, np.newaxis]
+        self.table[padding] = np.broadcast_to(self.table[:, :1],
+                                              self.table.shape)[padding]
+
+    def nearest(self, colors, chunk=1 << 16):
+        """Gets the palette index of the nearest color to each (r, g, b) row"""
+        colors = np.asarray(colors, dtype=np.int32).reshape((-1, 3))
+        if colors.size > 0 and (colors.min() < 0 or colors.max() > 255):
+            raise ValueError("Expected RGB values from 0 to 255")
+
+        result = np.empty(len(colors), dtype=np.intp)
+        cells = colors // self.CELL_SIZE
+        per_axis = 256 // self.CELL_SIZE
+        cells = (cells[:, 0] * per_axis + cells[:, 1]) * per_axis + cells[:, 2]
+
+        for start in xrange(0, len(colors), chunk):
+            stop = start + chunk
+            candidates = self.table[cells[start:stop]]
+            diff = self.rgb[candidates] - colors[start:stop, np.newaxis]
+            best = (diff * diff).sum(axis=2).argmin(axis=1)
+            result[start:stop] = candidates[np.arange(len(candidates)), best]
+
+        return result
+
+# Indexes for the palettes used so far (see _colorindex)
+_color_indexes = {}
+
+def _colorindex(palette=None):
+    """Gets the _ColorIndex of a palette of names (default: every color)"""
+    names = tuple(sorted(color_names) if palette is None else palette)
+    if names not in _color_indexes:
+        for name in names:
+            if name not in color_names:
+                msg = "Expected a color name, but got {0} instead!"
+                raise ValueError(msg.format(name))
+
+        if len(names) == 0:
+            raise ValueError("Expected at least one color in the palette")
+
+        _color_indexes[names] = _ColorIndex(names)
+
+    return _color_indexes[names]
+
+def _writepng(out, size, blocks, compress_level=6):
+    """
+    Writes an RGB PNG file to 'out' one block of rows at a time.
+
+    Parameters
+    ----------
+    out : file
+        Binary file to write to
+    size : tuple of int
+        Size of the image in pixels (width, height)
+    blocks : iterable
+        Arrays of shape (rows, width, 3) from top to bottom
+    compress_level : int, optional
+        zlib compression level (default: 6)
+
+    """
+    def write_chunk(kind, data):
+        out.write(struct.pack(">I", len(data)))
+        out.write(kind)
+        out.write(data)
+        out.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)) & 0xffffffff))
+
+    width, height = size
+    out.write(b"\x89PNG\r\n\x1a\n")
+    write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    compressor = zlib.compressobj(compress_level)
+    previous = np.zeros((1, width * 3), dtype=np.uint8)
+    for block in blocks:
+        # Each scanline starts with its filter type (2 = difference from
+        # the scanline above, which compresses well and is cheap to apply)
+        block = block.reshape(block.shape[0], -1)
+        lines = np.empty((block.shape[0], 1 + (width * 3)), dtype=np.uint8)
+        lines[:, 0] = 2
+        lines[:1, 1:] = block[:1] - previous
+        lines[1:, 1:] = block[1:] - block[:-1]
+        previous = block[-1:]
+
+        data = compressor.compress(lines.tobytes())
+        if data:
+            write_chunk(b"IDAT", data)
+
+    write_chunk(b"IDAT", compressor.flush())
+    write_chunk(b"IEND", b"")
+
+def _spillarray(shape):
+    """
+    Creates a uint8 array of the given shape backed by a memory-mapped
+    temporary file.  The file is removed once nothing uses the array.
+    """
+    handle, path = tempfile.mkstemp(suffix=".npy")
+    os.close(handle)
+    array = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8,
+                                      shape=shape)
+
+    try:
+        # The mapping stays valid after the file is unlinked
+        os.remove(path)
+    except OSError:
+        pass
+
+    return array
+
+def _runstrips(fn, height, parallel=True):
+    """
+    Calls fn(top, bottom) for horizontal strips of rows covering
+    [0, height), using the thread pool if set_threads enabled one.
+    """
+    pool = _threads["pool"]
+    if pool is None or not parallel or height < 2:
+        fn(0, height)
+        return
+
+    # About two strips per thread to even out the work
+    count = min(height, _threads["count"] * 2)
+    bounds = [(height * i) // count for i in xrange(count + 1)]
+    pool.map(lambda strip: fn(*strip), zip(bounds[:-1], bounds[1:]))
+
+def _blocks(top, bottom, width):
+    """
+    Splits rows [top, bottom) of a picture 'width' pixels wide into blocks
+    of about _BLOCK_PIXELS pixels, as (top, bottom) pairs.
+    """
+    rows = max(1, _BLOCK_PIXELS // max(1, width))
+    for start in xrange(top, bottom, rows):
+        yield start, min(start + rows, bottom)
+
+def _mapstrips(fn, array, out=None, halo=0):
+    """
+    Applies fn to horizontal strips of 'array' in parallel (see
+    set_threads) and writes the results into 'out' (default: back into
+    'array').  This is the layer for filters: for neighborhood operations,
+    each strip is passed with up to 'halo' extra rows above and below it;
+    fn returns an array with the same number of rows as it was given and
+    the extra rows are dropped, so results don't depend on the number of
+    threads.
+    """
+    if out is None:
+        out = array
+        if halo > 0:
+            # Strips must not see rows their neighbors already changed
+            array = array.copy()
+
+    height = len(array)
+    def run(top, bottom):
+        start, stop = max(0, top - halo), min(height, bottom + halo)
+        result = fn(array[start:stop])
+        out[top:bottom] = result[top - start:bottom - start]
+
+    _runstrips(run, height)
+    return out
+
+def _resize(image, size, resample="nearest", box=None):
+    """
+    Resizes an image array to size (width, height) with PIL.  Nearest
+    neighbor resizing is done one strip of output rows per thread if
+    set_threads enabled several; other filters are left to PIL, since
+    resizing strips separately changes their rounding.  If 'box' is
+    given, only that (left, top, right, bottom) region of the array is
+    resized (in array coordinates, which may be fractional).  See
+    _resample_filters for the filter names.
+    """
+    resample = getattr(Image, _resample_filters[resample])
+    source = Image.fromarray(image)
+    if box is None:
+        box = (0, 0, image.shape[1], image.shape[0])
+
+    if _threads["pool"] is None or resample != Image.NEAREST:
+        return np.array(source.resize(size, resample, box=box))
+
+    # Ask PIL which source row and column it picks for each output pixel,
+    # then copy them with NumPy
+    width, height = size
+    result = np.empty((height, width, 3), dtype=np.uint8)
+    rows = np.arange(image.shape[0], dtype=np.int32)[:, np.newaxis]
+    rows = np.asarray(Image.fromarray(rows).resize(
+        (1, height), resample, box=(0, box[1], 1, box[3])))
+    cols = np.arange(image.shape[1], dtype=np.int32)[np.newaxis, :]
+    cols = np.asarray(Image.fromarray(cols).resize(
+        (width, 1), resample, box=(box[0], 0, box[2], 1)))
+
+    def resize_strip(top, bottom):
+        result[top:bottom] = image[rows[top:bottom, 0]][:, cols[0]]
+
+    _runstrips(resize_strip, height)
+    return result
+
+def _reduce(image, size):
+    """
+    Decodes an image at the given (width, height) in RGB, letting the
+    decoder skip as much work as it can: JPEG files are decoded at 1/2,
+    1/4 or 1/8 scale (DCT scaling) and other images are shrunk by a whole
+    factor (if PIL supports it) before the final resize.
+    """
+    image.draft("RGB", size)
+    image = image.convert("RGB")
+
+    factor = min(image.size[0] // size[0], image.size[1] // size[1])
+    if factor > 1 and hasattr(image, "reduce"):
+        image = image.reduce(factor)
+
+    if image.size != size:
+        image = image.resize(size, Image.NEAREST)
+
+    return image
+
+def _rgbstrips(image, rows):
+    """
+    Yields (top, bottom, pixels) for strips of 'rows' rows of a PIL image,
+    with the pixels as a (rows, width, 3) uint8 array (or one that
+    broadcasts to it).  RGB, RGBA, grayscale and palette images are
+    converted with NumPy; other modes are converted by PIL.
+    """
+    width, height = image.size
+    channels = { "RGB": 3, "RGBA": 4, "RGBX": 4, "L": 1, "P": 1 }.get(image.mode)
+    if image.mode == "P":
+        palette = np.zeros((256, 3), dtype=np.uint8)
+        colors = np.array(image.getpalette() or [], dtype=np.uint8)
+        colors = colors.reshape((-1, 3))[:256]
+        palette[:len(colors)] = colors
+
+    for top in xrange(0, height, rows):
+        bottom = min(top + rows, height)
+        strip = image.crop((0, top, width, bottom))
+        if channels is None:
+            strip = np.asarray(strip.convert("RGB"), dtype=np.uint8)
+        else:
+            strip = np.frombuffer(strip.tobytes(), dtype=np.uint8)
+            strip = strip.reshape((bottom - top, width, channels))
+            if image.mode == "P":
+                strip = palette[strip[:, :, 0]]
+            elif image.mode != "L":
+                # Drop alpha (grayscale broadcasts over the three channels)
+                strip = strip[:, :, :3]
+
+        yield top, bottom, strip
+
+def _tileslice(key, length):
+    """Converts an int or slice along one axis into a slice of tiles"""
+    if isinstance(key, slice):
+        indices = xrange(*key.indices(length))
+        if len(indices) == 0:
+            return slice(0, 0)
+
+        first, last = sorted((indices[0], indices[-1]))
+    else:
+        first = last = key
+
+    return slice(first // TILE_SIZE, last // TILE_SIZE + 1)
+
+def _compresstile(array):
+    """Compresses an array of pixels into (shape, bytes)"""
+    array = np.ascontiguousarray(array, dtype=np.uint8)
+    return (array.shape, zlib.compress(array.tobytes(), 1))
+
+def _writeable(array):
+    """Checks if an array of pixels can be written to"""
+    return not isinstance(array, np.ndarray) or array.flags.writeable
+
+def _backed(array):
+    """
+    Checks if an array's memory belongs to something other than NumPy,
+    like a memory-mapped file or a buffer, which changes have to reach
+    """
+    while isinstance(array, np.ndarray) and array.base is not None:
+        array = array.base
+
+    return not isinstance(array, np.ndarray)
+
+def _haschanges(changes):
+    """Checks if any tiles were saved for undo (see Picture._journal)"""
+    return changes["image"] is not None or len(changes["tiles"]) > 0
+
+def _decompresstile(data):
+    """Decompresses an array of pixels (see _compresstile)"""
+    shape, compressed = data
+    return np.frombuffer(zlib.decompress(compressed), dtype=np.uint8).reshape(shape).copy()
+
 # ---------------------------------------------------------------------------- 
 
-def open(path):
+def open(path, backing="memory", size=None, max_size=None):
     """
-    Creates a new Picture object from the given image path.
+    Creates a new Picture object from the given image path.  Only the
+    image header is read until the pixels are first used.
 
     Parameters
     ----------
     path : str
         File system path to the image
+    backing : str, optional
+        Where to keep the pixels: "memory" (default), "mmap" for a
+        memory-mapped temporary file, for images too big to fit in memory,
+        or "tiled" for a memory-mapped file read through a cache of tiles
+    size : tuple of int, optional
+        Size (width, height) to resize the picture to while decoding
+    max_size : tuple of int, optional
+        Largest size (width, height) to shrink the picture to while
+        decoding, keeping its aspect ratio
 
     Returns
     -------
     p : Picture
 
     """
-    return Picture(path=os.path.abspath(path))
+    if backing == "tiled":
+        picture = TiledPicture(path=os.path.abspath(path), backing=backing)
+    else:
+        picture = Picture(path=os.path.abspath(path), backing=backing)
+
+    if (size is not None) or (max_size is not None):
+        picture._setdecodesize(size, max_size)
+
+    return picture
 
 def new(size, color="black"):
     """
@@ -143,9 +575,452 @@ def copy(image):
     """
     return Picture(image=image)
 
+def set_display(format="png", compress_level=1, quality=90):
+    """
+    Chooses how pictures are encoded for display in IPython.  Low PNG
+    compression levels encode much faster at the cost of larger output.
+
+    Parameters
+    ----------
+    format : str, optional
+        Either "png" (lossless, default) or "jpeg" (faster for photos)
+    compress_level : int, optional
+        zlib compression level for PNG, from 0 (none) to 9 (default: 1)
+    quality : int, optional
+        JPEG quality, from 1 to 95 (default: 90)
+
+    """
+    if format not in ("png", "jpeg"):
+        msg = "Expected display format 'png' or 'jpeg', but got {0} instead!"
+        raise ValueError(msg.format(format))
+
+    _display.update(format=format, compress_level=int(compress_level),
+                    quality=int(quality))
+
+def set_threads(n):
+    """
+    Sets how many threads are used for whole-picture operations, such as
+    resizing and setting a color channel.  Each picture is split into
+    horizontal strips that are processed in parallel.
+
+    Parameters
+    ----------
+    n : int
+        Number of threads (1, the default, disables threading)
+
+    """
+    n = int(n)
+    if n < 1:
+        msg = "Expected a number of threads greater than zero, but got {0} instead!"
+        raise ValueError(msg.format(n))
+
+    if _threads["pool"] is not None:
+        _threads["pool"].close()
+
+    _threads["count"] = n
+    _threads["pool"] = multiprocessing.pool.ThreadPool(n) if n > 1 else None
+
+def parse_colors(colors):
+    """
+    Converts many colors at once to an array of (r, g, b) rows.
+
+    Parameters
+    ----------
+    colors : list or array
+        Color names, hex strings (#RRGGBB) or RGB tuples, or an N x 3
+        array of RGB values
+
+    Returns
+    -------
+    rgb : array
+        N x 3 array of uint8
+
+    """
+    if isinstance(colors, np.ndarray) and colors.dtype.kind in "biuf":
+        array = colors
+    else:
+        array = np.array([_parse_color(c) for c in colors]).reshape((-1, 3))
+
+    if array.ndim != 2 or array.shape[1] != 3:
+        msg = "Expected N x 3 RGB values, but got shape {0} instead!"
+        raise ValueError(msg.format(array.shape))
+    elif array.size > 0 and (array.min() < 0 or array.max() > 255):
+        raise ValueError("Expected RGB values from 0 to 255")
+
+    return array.astype(np.uint8)
+
+def nearest_color_name(color, palette=None):
+    """
+    Finds the name of the color closest to the given one.
+
+    Parameters
+    ----------
+    color : str or tuple
+        Color name, hex string (#RRGGBB) or RGB tuple
+    palette : list of str, optional
+        Names of the colors to choose from (default: every color name)
+
+    Returns
+    -------
+    name : str
+
+    """
+    index = _colorindex(palette)
+    return index.names[index.nearest(parse_colors([color]))[0]]
+
+ProbeInfo = collections.namedtuple("ProbeInfo",
+                                   ["path", "size", "format", "mode", "frames"])
+
+def _probecachepath():
+    """Gets the default location of the probe() metadata cache"""
+    cache_dir = os.environ.get("XDG_CACHE_HOME",
+                               os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_dir, "image_novice", "probe.json")
+
+# Probe caches already read by this process: cache path -> (stamp, entries)
+_probe_caches = {}
+
+def _filestamp(path):
+    """Gets the (modification time, size) of a file, or None if missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+def _loadprobecache(cache_path):
+    """
+    Gets the entries of a probe() cache file.  The file is only read again
+    if it changed since this process last read or wrote it.
+    """
+    stamp = _filestamp(cache_path)
+    known = _probe_caches.get(cache_path)
+    if known is not None and known[0] == stamp:
+        return known[1]
+
+    cache = {}
+    if stamp is not None:
+        try:
+            with io.open(cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+        except ValueError:
+            # Unreadable cache; start over
+            cache = {}
+
+    _probe_caches[cache_path] = (stamp, cache)
+    return cache
+
+def probe(path, cache_path=None):
+    """
+    Reads the size, format, mode and number of frames of an image from its
+    header, without decoding any pixels.  Each call that finds a new or
+    changed file rewrites the whole cache, so use probe_many to look at
+    many files at once.
+
+    Parameters
+    ----------
+    path : str
+        File system path to the image
+    cache_path : str or False, optional
+        Metadata cache file (default: ~/.cache/image_novice/probe.json),
+        or False to not use a cache
+
+    Returns
+    -------
+    info : ProbeInfo
+        (path, size, format, mode, frames) with size as (width, height)
+
+    """
+    return probe_many([path], cache_path=cache_path)[0]
+
+def probe_many(paths, cache_path=None):
+    """
+    Reads the size, format, mode and number of frames of many images from
+    their headers, without decoding any pixels.  Results are kept in a
+    cache file keyed on each file's path, modification time and size, so
+    files that have not changed are not opened again.
+
+    Parameters
+    ----------
+    paths : iterable of str
+        File system paths to the images
+    cache_path : str or False, optional
+        Metadata cache file (default: ~/.cache/image_novice/probe.json),
+        or False to not use a cache
+
+    Returns
+    -------
+    infos : list of ProbeInfo
+        (path, size, format, mode, frames) for each path, in order
+
+    """
+    if cache_path is None:
+        cache_path = _probecachepath()
+
+    cache = _loadprobecache(cache_path) if cache_path else {}
+    found = {}
+    infos = []
+    try:
+        for path in paths:
+            path = os.path.abspath(path)
+            stat = os.stat(path)
+            entry = found.get(path) or cache.get(path)
+            if entry is None or entry[:2] != [stat.st_mtime, stat.st_size]:
+                with io.open(path, "rb") as image_file:
+                    header = Image.open(image_file)
+                    entry = [stat.st_mtime, stat.st_size, header.size[0],
+                             header.size[1], header.format.lower(),
+                             header.mode, getattr(header, "n_frames", 1)]
+
+                found[path] = entry
+
+            infos.append(ProbeInfo(path, (entry[2], entry[3]), entry[4],
+                                   entry[5], entry[6]))
+    finally:
+        if cache_path and found:
+            # Merge into the file as it is now, so entries written by other
+            # processes since it was loaded are kept
+            cache = _loadprobecache(cache_path)
+            cache.update(found)
+
+            cache_dir = os.path.dirname(os.path.abspath(cache_path))
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+
+            # Write a new file and move it into place so readers never see
+            # a partial cache
+            handle, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(handle, "w") as cache_file:
+                json.dump(cache, cache_file)
+            os.rename(tmp_path, cache_path)
+            _probe_caches[cache_path] = (_filestamp(cache_path), cache)
+
+    return infos
+
+BatchResult = collections.namedtuple("BatchResult", ["path", "result", "error"])
+
+def _batchitem(args):
+    """Opens, transforms and saves one picture for batch()"""
+    path, fn, out_dir = args
+    try:
+        picture = open(path)
+        result = fn(picture)
+        if out_dir is not None:
+            picture.save(os.path.join(out_dir, os.path.basename(path)))
+
+        return BatchResult(path, result, None)
+    except Exception as e:
+        return BatchResult(path, None, e)
+
+def batch(paths, fn, workers=None, out_dir=None):
+    """
+    Opens each picture, calls fn(picture) on it and, if 'out_dir' is
+    given, saves the picture there under the same file name.  Pictures
+    are processed in parallel by a pool of worker processes.
+
+    Parameters
+    ----------
+    paths : iterable of str
+        File system paths to the images
+    fn : function
+        Called with each Picture; must be defined at the top level of a
+        module so worker processes can find it
+    workers : int, optional
+        Number of worker processes (default: one per CPU)
+    out_dir : str, optional
+        Directory to save the pictures into (created if missing)
+
+    Returns
+    -------
+    results : iterator of BatchResult
+        (path, result, error) for each file, in the order they finish.
+        'result' is the return value of fn, or 'error' is the exception
+        that stopped the file from being processed.
+
+    """
+    if out_dir is not None and not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    items = ((os.path.abspath(path), fn, out_dir) for path in paths)
+    if workers == 1:
+        # No need for other processes
+        for item in items:
+            yield _batchitem(item)
+        return
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        for result in pool.imap_unordered(_batchitem, items):
+            yield result
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+def pipeline(source, prefetch=4):
+    """
+    Creates a Pipeline that opens each picture in 'source'.  Add stages
+    with map() and run it with save() or by iterating over it.
+
+    Example:
+        novice.pipeline(paths).map(brighten).save("out/{name}.png")
+
+    Parameters
+    ----------
+    source : iterable of str or Picture
+        File system paths to the images (or pictures)
+    prefetch : int, optional
+        Number of pictures that may wait between two stages (default: 4)
+
+    Returns
+    -------
+    p : Pipeline
+
+    """
+    return Pipeline(source, prefetch=prefetch)
+
+class _Failure(object):
+    """Carries an exception from a pipeline stage to the consumer"""
+    def __init__(self, error):
+        self.error = error
+
+# Marks the end of the pictures in a pipeline queue
+_END = object()
+
+class Pipeline(object):
+    """
+    A chain of stages that decode, transform and encode pictures.  Each
+    stage runs in its own thread and hands pictures to the next through a
+    bounded queue, so reading files, NumPy work and writing files overlap
+    while only a few pictures are in memory at once.
+    """
+    def __init__(self, source, prefetch=4, stages=()):
+        self._source = source
+        self._prefetch = max(1, int(prefetch))
+        self._stages = list(stages)
+
+    def map(self, fn):
+        """
+        Returns a new Pipeline that also calls fn(picture) on each picture.
+        If fn returns a Picture, that picture is passed on instead.
+        """
+        def transform(item):
+            index, path, picture = item
+            result = fn(picture)
+            return (index, path, result if isinstance(result, Picture) else picture)
+
+        return Pipeline(self._source, self._prefetch, self._stages + [transform])
+
+    def save(self, pattern):
+        """
+        Runs the pipeline and saves every picture.  'pattern' is formatted
+        with the source file name ('name', without its extension) and the
+        position of the picture in the source ('index'), e.g.
+        "out/{name}-small.jpg".  Returns the saved paths in order.
+        """
+        def encode(item):
+            index, path, picture = item
+            name = os.path.splitext(os.path.basename(path or ""))[0]
+            out_path = pattern.format(name=name, index=index)
+            out_dir = os.path.dirname(os.path.abspath(out_path))
+            if not os.path.isdir(out_dir):
+                os.makedirs(out_dir)
+
+            picture.save(out_path)
+            return (index, path, picture.path)
+
+        pipe = Pipeline(self._source, self._prefetch, self._stages + [encode])
+        return [picture_path for index, path, picture_path in pipe._run()]
+
+    def __iter__(self):
+        """Runs the pipeline, yielding each picture in order"""
+        for index, path, picture in self._run():
+            yield picture
+
+    def _run(self):
+        """Starts the stage threads and yields (index, path, result) items"""
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=self._prefetch)
+                  for _ in xrange(len(self._stages) + 1)]
+
+        threads = [threading.Thread(target=self._decode, args=(queues[0], stop))]
+        for stage, in_queue, out_queue in zip(self._stages, queues[:-1], queues[1:]):
+            threads.append(threading.Thread(target=self._transform,
+                                            args=(stage, in_queue, out_queue, stop)))
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END:
+                    break
+                elif isinstance(item, _Failure):
+                    raise item.error
+
+                yield item
+        finally:
+            # Lets the threads finish if iteration stopped early
+            stop.set()
+
+    @staticmethod
+    def _put(out_queue, item, stop):
+        """Waits for room in the queue, giving up if the pipeline stops"""
+        while not stop.is_set():
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _decode(self, out_queue, stop):
+        """Opens the source pictures and decodes their pixels"""
+        try:
+            for index, source in enumerate(self._source):
+                if isinstance(source, Picture):
+                    item = (index, source.path, source)
+                else:
+                    picture = open(source)
+                    if picture._source is not None:
+                        picture._decode()
+
+                    item = (index, picture.path, picture)
+
+                if not self._put(out_queue, item, stop):
+                    return
+        except Exception as e:
+            self._put(out_queue, _Failure(e), stop)
+            return
+
+        self._put(out_queue, _END, stop)
+
+    def _transform(self, stage, in_queue, out_queue, stop):
+        """Applies a stage to every item until the end of the source"""
+        while not stop.is_set():
+            try:
+                item = in_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if item is not _END and not isinstance(item, _Failure):
+                try:
+                    item = stage(item)
+                except Exception as e:
+                    item = _Failure(e)
+
+            if not self._put(out_queue, item, stop) or item is _END:
+                return
+
 # ---------------------------------------------------------------------------- 
 
 class Pixel(object):
+    __slots__ = ("_picture", "_image", "_x", "_y", "_red", "_green", "_blue")
+
     def __init__(self, pic, image, x, y, rgb):
         self._picture = pic
         self._image = image
@@ -205,44 +1080,664 @@ class Pixel(object):
         # Allow color to be set by name or hex string
         value = _parse_color(value)
 
-        # Ensure that RGB components are within range
-        self._red, self._green, self._blue = (self._validate(v) for v in value)
-        self._setpixel()
-
-    def _validate(self, value):
-        """Verifies that the pixel value is in [0, 255]"""
-        try:
-            value = int(value)
-            if (value < 0) or (value > 255):
-                raise ValueError()
-        except ValueError:
-            msg = "Expected an integer between 0 and 255, but got {0} instead!"
-            raise ValueError(msg.format(value))
+        # Ensure that RGB components are within range
+        self._red, self._green, self._blue = (self._validate(v) for v in value)
+        self._setpixel()
+
+    def _validate(self, value):
+        """Verifies that the pixel value is in [0, 255]"""
+        try:
+            value = int(value)
+            if (value < 0) or (value > 255):
+                raise ValueError()
+        except ValueError:
+            msg = "Expected an integer between 0 and 255, but got {0} instead!"
+            raise ValueError(msg.format(value))
+
+        return value
+
+    def _setpixel(self):
+        """
+        Sets the actual pixel value in the picture.
+        NOTE: Using Cartesian coordinate system!
+        """
+        row = self._picture.height - self._y - 1
+
+        # Modified pictures lose their paths (and may get a new array)
+        self._picture._setmodified(row, self._x)
+        self._picture._image[row, self._x] = (self.red, self.green, self.blue)
+
+    def __repr__(self):
+        return "Pixel (red: {0}, green: {1}, blue: {2})"\
+            .format(self.red, self.green, self.blue)
+
+class _PixelCursor(Pixel):
+    """
+    A single Pixel that is moved across the picture during iteration.
+    Changes are buffered and written back a row at a time, when the cursor
+    moves to another row or iteration ends.
+    """
+    __slots__ = ("_row", "_dirty", "_changes")
+
+    def __init__(self, pic):
+        self._picture = pic
+        self._row = None
+        self._dirty = False
+
+        # Colors of the changed pixels of the row, by column
+        self._changes = {}
+
+    def _moveto(self, x, y):
+        """Buffers any changes and moves to a new location"""
+        if self._dirty:
+            self._changes[self._x] = (self._red, self._green, self._blue)
+            self._dirty = False
+
+        # Read through the picture, whose array changes when it is copied
+        # on write
+        image = self._picture._image
+        row = image.shape[0] - y - 1
+        if row != self._row:
+            self._flush()
+            self._row = row
+
+        self._x = x
+        self._y = y
+        rgb = self._changes.get(x)
+        if rgb is None:
+            rgb = image[row, x].tolist()
+
+        self._red, self._green, self._blue = rgb
+
+    def _setpixel(self):
+        self._dirty = True
+
+    def _flush(self):
+        """Writes buffered changes into the picture"""
+        if self._dirty:
+            self._changes[self._x] = (self._red, self._green, self._blue)
+            self._dirty = False
+
+        if self._changes:
+            cols = sorted(self._changes)
+            span = slice(cols[0], cols[-1] + 1)
+
+            # Modified pictures lose their paths (and may get a new array)
+            self._picture._setmodified(self._row, span)
+            image = self._picture._image
+            block = image[self._row, span]
+            block[np.array(cols) - cols[0]] = [self._changes[c] for c in cols]
+            image[self._row, span] = block
+            self._changes = {}
+
+# ----------------------------------------------------------------------------
+
+class PixelBatch(object):
+    """
+    A rectangular block of pixels with the same interface as Pixel, except
+    that every attribute is a NumPy array with one entry per pixel.
+    Arrays are indexed [row, column] with row 0 at the bottom of the block.
+    NOTE: Using Cartesian coordinate system!
+    """
+    def __init__(self, pic, x0, y0, x1, y1):
+        self._picture = pic
+        self._x0 = x0
+        self._y0 = y0
+        self._x1 = x1
+        self._y1 = y1
+
+    def _key(self):
+        """Gets the (rows, columns) of the batch in the underlying array"""
+        height = self._picture.height
+        return (slice(height - self._y1, height - self._y0),
+                slice(self._x0, self._x1))
+
+    def _getchannel(self, dim):
+        rows, cols = self._key()
+        return self._picture._image[rows, cols, dim][::-1].copy()
+
+    def _setchannel(self, dim, value):
+        rows, cols = self._key()
+        value = self._validate(value)
+        if value.ndim >= 2:
+            # Flip rows back into array order
+            value = value[::-1]
+
+        # Modified pictures lose their paths
+        self._picture._setmodified(rows, cols)
+        self._picture._image[rows, cols, dim] = value
+
+    @property
+    def x(self):
+        """Gets the horizontal location of each pixel (left = 0)"""
+        x = np.arange(self._x0, self._x1)
+        return np.tile(x, (self._y1 - self._y0, 1))
+
+    @property
+    def y(self):
+        """Gets the vertical location of each pixel (bottom = 0)"""
+        y = np.arange(self._y0, self._y1)[:, np.newaxis]
+        return np.repeat(y, self._x1 - self._x0, axis=1)
+
+    @property
+    def red(self):
+        """Gets or sets the red components"""
+        return self._getchannel(0)
+
+    @red.setter
+    def red(self, value):
+        self._setchannel(0, value)
+
+    @property
+    def green(self):
+        """Gets or sets the green components"""
+        return self._getchannel(1)
+
+    @green.setter
+    def green(self, value):
+        self._setchannel(1, value)
+
+    @property
+    def blue(self):
+        """Gets or sets the blue components"""
+        return self._getchannel(2)
+
+    @blue.setter
+    def blue(self, value):
+        self._setchannel(2, value)
+
+    @property
+    def rgb(self):
+        return (self.red, self.green, self.blue)
+
+    @rgb.setter
+    def rgb(self, value):
+        """Gets or sets the colors with a color or an (r, g, b) tuple of arrays"""
+        if isinstance(value, str) or \
+                (isinstance(value, tuple) and all(np.isscalar(v) for v in value)):
+            # Same color for every pixel in the batch
+            value = _parse_color(value)
+        elif len(value) != 3:
+            msg = "Color tuple must be of the form (r, g, b)"
+            raise ValueError(msg)
+
+        # Stack (r, g, b) into a rows x columns x 3 array
+        shape = (self._y1 - self._y0, self._x1 - self._x0)
+        self._setchannel(slice(None),
+                         np.dstack([v * np.ones(shape) for v in value]))
+
+    def _validate(self, value):
+        """Verifies that the pixel values are in [0, 255]"""
+        value = np.asarray(value)
+        if value.dtype.kind not in "biuf":
+            msg = "Expected integers between 0 and 255, but got {0} instead!"
+            raise ValueError(msg.format(value))
+
+        bad = (value <= -1) | (value >= 256)
+        if np.any(bad):
+            msg = "Expected an integer between 0 and 255, but got {0} instead!"
+            raise ValueError(msg.format(value[bad].flat[0]))
+
+        return value.astype(np.uint8)
+
+    def __repr__(self):
+        return "PixelBatch (x: {0}-{1}, y: {2}-{3})"\
+            .format(self._x0, self._x1 - 1, self._y0, self._y1 - 1)
+
+# ----------------------------------------------------------------------------
+
+class _Untraceable(BaseException):
+    """Raised when a pixel function cannot be run on symbolic values"""
+    pass
+
+class _DeadPath(BaseException):
+    """Raised when no pixels follow the current branch decisions"""
+    pass
+
+def _classic_divide(a, b):
+    """Divides like Python 2 '/' (floor division for integers)"""
+    if np.asarray(a).dtype.kind in "biu" and np.asarray(b).dtype.kind in "biu":
+        return np.floor_divide(a, b)
+
+    return np.true_divide(a, b)
+
+def _symbolic_op(op, reflected=False, divides=False):
+    """
+    Creates a _Symbol operator method that applies op (a function or the
+    name of a NumPy ufunc) to whole arrays
+    """
+    def method(self, other):
+        if isinstance(other, _Symbol):
+            other = other._array
+        elif not isinstance(other, numbers.Number):
+            return NotImplemented
+
+        a, b = (other, self._array) if reflected else (self._array, other)
+        if divides:
+            self._tracer.checkdivisor(b)
+
+        fn = getattr(np, op) if isinstance(op, str) else op
+        return _Symbol(self._tracer, fn(a, b))
+
+    return method
+
+def _untraceable(self, *args):
+    raise _Untraceable()
+
+class _Symbol(object):
+    """
+    The value of an expression for every traced pixel at once.  Arithmetic
+    and comparisons work element-wise; using a _Symbol as a condition asks
+    the tracer which branch to follow.
+    """
+    __slots__ = ("_tracer", "_array")
+    __hash__ = None
+
+    # Keep NumPy scalars from treating symbols as arrays
+    __array_priority__ = 100
+    __array_ufunc__ = None
+
+    def __init__(self, tracer, array):
+        self._tracer = tracer
+        self._array = array
+
+    __add__ = _symbolic_op("add")
+    __radd__ = _symbolic_op("add", reflected=True)
+    __sub__ = _symbolic_op("subtract")
+    __rsub__ = _symbolic_op("subtract", reflected=True)
+    __mul__ = _symbolic_op("multiply")
+    __rmul__ = _symbolic_op("multiply", reflected=True)
+    __div__ = _symbolic_op(_classic_divide, divides=True)
+    __rdiv__ = _symbolic_op(_classic_divide, reflected=True, divides=True)
+    __truediv__ = _symbolic_op("true_divide", divides=True)
+    __rtruediv__ = _symbolic_op("true_divide", reflected=True, divides=True)
+    __floordiv__ = _symbolic_op("floor_divide", divides=True)
+    __rfloordiv__ = _symbolic_op("floor_divide", reflected=True, divides=True)
+    __mod__ = _symbolic_op("mod", divides=True)
+    __rmod__ = _symbolic_op("mod", reflected=True, divides=True)
+    __pow__ = _symbolic_op("power")
+    __rpow__ = _symbolic_op("power", reflected=True)
+    __and__ = _symbolic_op("bitwise_and")
+    __rand__ = _symbolic_op("bitwise_and", reflected=True)
+    __or__ = _symbolic_op("bitwise_or")
+    __ror__ = _symbolic_op("bitwise_or", reflected=True)
+    __xor__ = _symbolic_op("bitwise_xor")
+    __rxor__ = _symbolic_op("bitwise_xor", reflected=True)
+
+    __lt__ = _symbolic_op("less")
+    __le__ = _symbolic_op("less_equal")
+    __gt__ = _symbolic_op("greater")
+    __ge__ = _symbolic_op("greater_equal")
+    __eq__ = _symbolic_op("equal")
+    __ne__ = _symbolic_op("not_equal")
+
+    def __neg__(self):
+        return _Symbol(self._tracer, -self._array)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _Symbol(self._tracer, np.abs(self._array))
+
+    def __invert__(self):
+        return _Symbol(self._tracer, ~self._array)
+
+    def __nonzero__(self):
+        return self._tracer.branch(self._array.astype(bool))
+
+    __bool__ = __nonzero__
+
+    # Anything that needs a single concrete value cannot be traced
+    __int__ = __long__ = __float__ = __index__ = __iter__ = _untraceable
+
+    def __repr__(self):
+        return "<traced pixel value>"
+
+class _TracedPixel(object):
+    """Stands in for every Pixel at once while tracing"""
+    __slots__ = ("_tracer",)
+
+    def __init__(self, tracer):
+        self._tracer = tracer
+
+    @property
+    def x(self):
+        return _Symbol(self._tracer, self._tracer.x)
+
+    @property
+    def y(self):
+        return _Symbol(self._tracer, self._tracer.y)
+
+    @property
+    def red(self):
+        return _Symbol(self._tracer, self._tracer.channels[0])
+
+    @red.setter
+    def red(self, value):
+        self._tracer.assign(0, value)
+
+    @property
+    def green(self):
+        return _Symbol(self._tracer, self._tracer.channels[1])
+
+    @green.setter
+    def green(self, value):
+        self._tracer.assign(1, value)
+
+    @property
+    def blue(self):
+        return _Symbol(self._tracer, self._tracer.channels[2])
+
+    @blue.setter
+    def blue(self, value):
+        self._tracer.assign(2, value)
+
+    @property
+    def rgb(self):
+        return (self.red, self.green, self.blue)
+
+    @rgb.setter
+    def rgb(self, value):
+        value = _parse_color(value)
+        for dim, v in enumerate(value):
+            self._tracer.assign(dim, v)
+
+class _Tracer(object):
+    """
+    Runs a pixel function on whole arrays of pixels.  Each run follows one
+    sequence of branch decisions (one path through the function) for the
+    pixels that agree with it.  Runs are repeated until every path taken
+    by at least one pixel has been followed.
+    """
+    max_paths = 64
+    max_branches = 32
 
-        return value
+    def __init__(self, x, y, rgb):
+        self.x = x
+        self.y = y
+        self._rgb = [np.asarray(c, dtype=np.int64) for c in rgb]
 
-    def _setpixel(self):
+    def run(self, fn):
         """
-        Sets the actual pixel value in the picture.
-        NOTE: Using Cartesian coordinate system!
+        Returns the new (red, green, blue) arrays and whether any pixel
+        was assigned to.  Raises _Untraceable if fn cannot be traced.
         """
-        self._image[self._picture.height - self._y - 1, self._x] = \
-                (self.red, self.green, self.blue)
+        result = [c.copy() for c in self._rgb]
+        wrote = False
+        self._pending = [[]]
+        num_paths = 0
+
+        while self._pending:
+            num_paths += 1
+            if num_paths > self.max_paths:
+                raise _Untraceable()
+
+            self._decisions = self._pending.pop()
+            self._taken = []
+            self._mask = np.ones(len(self.x), dtype=bool)
+            self._wrote = False
+            self.channels = list(self._rgb)
+
+            try:
+                with np.errstate(all="ignore"):
+                    fn(_TracedPixel(self))
+            except _DeadPath:
+                continue
+            except Exception:
+                raise _Untraceable()
+
+            # Keep this path's values for the pixels that followed it
+            for res, channel in zip(result, self.channels):
+                res[self._mask] = channel[self._mask]
+
+            wrote = wrote or self._wrote
+
+        return result, wrote
+
+    def branch(self, cond):
+        """Chooses a side of a condition and narrows the mask to match"""
+        index = len(self._taken)
+        if index >= self.max_branches:
+            raise _Untraceable()
+
+        if index < len(self._decisions):
+            # Replaying a path queued by an earlier run
+            taken = self._decisions[index]
+        elif not np.any(cond & self._mask):
+            taken = False
+        else:
+            taken = True
+            if np.any(self._mask & ~cond):
+                # Some pixels go the other way; follow them on a later run
+                self._pending.append(self._taken + [False])
+
+        self._taken.append(taken)
+        self._mask &= cond if taken else ~cond
+        if not np.any(self._mask):
+            raise _DeadPath()
+
+        return taken
+
+    def checkdivisor(self, value):
+        """Refuses to trace a division by zero (it raises per pixel)"""
+        if np.any((np.asarray(value) == 0) & self._mask):
+            raise _Untraceable()
+
+    def assign(self, dim, value):
+        """Sets a channel, checking values like Pixel._validate"""
+        if isinstance(value, _Symbol):
+            value = value._array
+        elif not isinstance(value, numbers.Number):
+            raise _Untraceable()
+
+        value = np.asarray(value)
+        inside = value[self._mask] if value.ndim else value
+        if value.dtype.kind == "f":
+            if not np.all(np.isfinite(inside)):
+                raise _Untraceable()
+            value = np.trunc(value)
+            inside = np.trunc(inside)
+        elif value.dtype.kind not in "biu":
+            raise _Untraceable()
+
+        if np.any((inside < 0) | (inside > 255)):
+            # Let the pixel-by-pixel path raise the usual error
+            raise _Untraceable()
+
+        channel = np.empty(len(self.x), dtype=np.int64)
+        channel[:] = value
+        self.channels[dim] = channel
+        self._wrote = True
 
-        # Modified pictures lose their paths
-        self._picture._setmodified()
+# ----------------------------------------------------------------------------
+
+def _lazy_op(op, reflected=False):
+    """
+    Creates an _Expression operator method that applies op (a function or
+    the name of a NumPy ufunc) when the expression is computed
+    """
+    def method(self, other):
+        if not isinstance(other, (_Expression, numbers.Number, np.ndarray, list)):
+            return NotImplemented
+
+        return _Expression(op, (other, self) if reflected else (self, other))
+
+    return method
+
+class _Expression(object):
+    """
+    An element-wise expression over picture channels, such as
+    pic.red * 0.3 + pic.green * 0.59 + pic.blue * 0.11, that is only
+    computed when it is used.  Assigning one to a channel computes it a
+    block of rows at a time, so temporaries stay small, and clips the
+    result to 0-255.  Used any other way, it acts like a flat NumPy array
+    with one value per pixel (top row first).  Channels keep the pixels
+    the picture had when they were made: changing a picture while one of
+    its channels is still in use gives the channel a copy of its plane.
+    """
+    __hash__ = None
+
+    # Make NumPy arrays leave operators with expressions to us
+    __array_priority__ = 100
+
+    def __init__(self, op, args):
+        self._op = op
+        self._args = args
+
+    def _channels(self):
+        """Yields the channels the expression reads"""
+        for arg in self._args:
+            if isinstance(arg, _Expression):
+                for channel in arg._channels():
+                    yield channel
+
+    def _size(self):
+        """Gets the (width, height) of the pictures in the expression"""
+        for arg in self._args:
+            if isinstance(arg, _Expression):
+                return arg._size()
+
+    def _evaluate(self, top, bottom):
+        """Computes rows [top, bottom) of the expression as a 2D array"""
+        width, height = self._size()
+        args = []
+        for arg in self._args:
+            if isinstance(arg, _Expression):
+                arg = arg._evaluate(top, bottom)
+            elif isinstance(arg, np.ndarray) and arg.ndim > 0:
+                # Arrays with a value for every pixel are cut into blocks
+                # along with the picture
+                if arg.shape == (width * height,):
+                    arg = arg.reshape((height, width))
+                if arg.ndim == 2 and arg.shape[0] == height:
+                    arg = arg[top:bottom]
+
+            # Widen small integers so sums and products don't wrap around
+            if isinstance(arg, np.ndarray) and arg.dtype.kind in "iu" and \
+                    arg.dtype.itemsize < 4:
+                arg = arg.astype(np.int32)
+
+            args.append(arg)
+
+        op = getattr(np, self._op) if isinstance(self._op, str) else self._op
+        return op(*args)
+
+    def __array__(self, dtype=None):
+        width, height = self._size()
+        array = None
+        for top, bottom in _blocks(0, height, width):
+            block = self._evaluate(top, bottom)
+            if array is None:
+                array = np.empty((height, width), dtype=block.dtype)
+
+            array[top:bottom] = block
+
+        array = array.ravel()
+        return array if dtype is None else array.astype(dtype)
+
+    def __getattr__(self, name):
+        # Everything else (shape, sum, reshape, ...) comes from the array,
+        # except special names, which NumPy probes for
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.__array__(), name)
+
+    def __len__(self):
+        width, height = self._size()
+        return width * height
+
+    def __iter__(self):
+        return iter(self.__array__())
+
+    def __getitem__(self, key):
+        return self.__array__()[key]
+
+    def __nonzero__(self):
+        return bool(self.__array__())
 
     def __repr__(self):
-        return "Pixel (red: {0}, green: {1}, blue: {2})"\
-            .format(self.red, self.green, self.blue)
+        return repr(self.__array__())
+
+    __add__ = _lazy_op("add")
+    __radd__ = _lazy_op("add", reflected=True)
+    __sub__ = _lazy_op("subtract")
+    __rsub__ = _lazy_op("subtract", reflected=True)
+    __mul__ = _lazy_op("multiply")
+    __rmul__ = _lazy_op("multiply", reflected=True)
+    __div__ = _lazy_op(_classic_divide)
+    __rdiv__ = _lazy_op(_classic_divide, reflected=True)
+    __truediv__ = _lazy_op("true_divide")
+    __rtruediv__ = _lazy_op("true_divide", reflected=True)
+    __floordiv__ = _lazy_op("floor_divide")
+    __rfloordiv__ = _lazy_op("floor_divide", reflected=True)
+    __mod__ = _lazy_op("mod")
+    __rmod__ = _lazy_op("mod", reflected=True)
+    __pow__ = _lazy_op("power")
+    __rpow__ = _lazy_op("power", reflected=True)
+    __and__ = _lazy_op("bitwise_and")
+    __rand__ = _lazy_op("bitwise_and", reflected=True)
+    __or__ = _lazy_op("bitwise_or")
+    __ror__ = _lazy_op("bitwise_or", reflected=True)
+    __xor__ = _lazy_op("bitwise_xor")
+    __rxor__ = _lazy_op("bitwise_xor", reflected=True)
+
+    __lt__ = _lazy_op("less")
+    __le__ = _lazy_op("less_equal")
+    __gt__ = _lazy_op("greater")
+    __ge__ = _lazy_op("greater_equal")
+    __eq__ = _lazy_op("equal")
+    __ne__ = _lazy_op("not_equal")
+
+    def __neg__(self):
+        return _Expression("negative", (self,))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _Expression("absolute", (self,))
+
+    def __invert__(self):
+        return _Expression("invert", (self,))
+
+class _Channel(_Expression):
+    """A single channel of a picture (see _Expression)"""
+
+    def __init__(self, picture, dim):
+        self._image = picture._image
+        if isinstance(self._image, _TiledArray):
+            # Only the tiles the picture changes later are copied
+            self._image = self._image.copy()
+
+        self._dim = dim
+        picture._channels[id(self)] = self
+
+    def _channels(self):
+        yield self
+
+    def _size(self):
+        return (self._image.shape[1], self._image.shape[0])
+
+    def _evaluate(self, top, bottom):
+        return np.asarray(self._image[top:bottom, :, self._dim])
+
+    def _detach(self):
+        """Copies the channel's plane, so the picture can change its array"""
+        dim = self._dim
+        self._image = np.array(self._image[:, :, dim:dim + 1])
+        self._dim = 0
 
 # ----------------------------------------------------------------------------
 
 class Picture(object):
     def __init__(self, path=None, size=None, color=None,
-                 image=None, array=None):
+                 image=None, array=None, backing="memory"):
         """
         If 'path' is provided, open that file (the normal case).
+        If 'backing' is "mmap" as well as 'path', decode the file into a
+        memory-mapped temporary file instead of memory.
         If 'size' is provided instead, create an image of that size.
         If 'color' is provided as well as 'size', initialize the
         created image to that color; otherwise, initialize to black.
@@ -251,18 +1746,34 @@ class Picture(object):
         Can only provide 'color' if 'size' provided.
         """
 
+        # File whose pixels have not been decoded yet
+        self._source = None
+        self._decode_size = None
+
+        # Size, crop and flip changes that have not been applied yet
+        # (see deferred)
+        self._geometry = None
+        self._deferring = 0
+
         # Can only provide either path or size, but not both.
         if (path and size) or (path and image) or (size and image):
             assert False, "Can only provide path, size, or image."
 
-        # Opening a particular file.  Convert the image to RGB
-        # automatically so (r, g, b) tuples can be used
-        # everywhere.
+        # Opening a particular file.  Only the header is read here; the
+        # pixels are decoded the first time they are needed.
         elif path is not None:
-            self._image = np.array(Image.open(path).convert("RGB"),
-                                   dtype=np.uint8)
+            with io.open(path, "rb") as image_file:
+                header = Image.open(image_file)
+                self._source_size = header.size
+                self._format = header.format.lower()
+
+            if backing not in ("memory", "mmap", "tiled"):
+                msg = "Expected backing 'memory', 'mmap' or 'tiled', but got {0} instead!"
+                raise ValueError(msg.format(backing))
+
+            self._source = os.path.abspath(path)
+            self._backing = backing
             self._path = os.path.abspath(path)
-            self._format = imghdr.what(path)
 
         # Creating a particular size of image.
         elif size is not None:
@@ -276,7 +1787,14 @@ class Picture(object):
             self._path = None
             self._format = None
         elif image is not None:
-            self._image = np.array(image, dtype=np.uint8)
+            # Shares memory with 'image' where possible; it is read-only so
+            # it is copied before the picture changes
+            array = np.asarray(image, dtype=np.uint8)
+            if array.flags.writeable:
+                array = array.view()
+                array.flags.writeable = False
+
+            self._image = array
             self._path = None
             self._format = None
         elif array is not None:
@@ -295,6 +1813,93 @@ class Picture(object):
         self._modified = False
         self._inflation = 1
 
+        # Pictures whose arrays share memory with this one's (see copy)
+        self._sharing = weakref.WeakSet([self])
+
+        # Channels in use, which keep the array they were made from
+        # (by id, since expressions can't be hashed)
+        self._channels = weakref.WeakValueDictionary()
+
+        # Changes that can be undone (see checkpoint)
+        self._history = None
+
+        # Weak references to the array whose memory was last handed out
+        # through __array_interface__ and to the view that handed it out
+        self._exported = None
+
+        # Every change stamps the tiles it touches with a new version, so
+        # changes since any earlier version can be found tile by tile.
+        self._version = 0
+        self._saved_version = 0
+        self._tiles = np.zeros(self._tileshape(), dtype=np.int64)
+        self._display_cache = None
+        self._inflated = None
+
+    def __getattr__(self, name):
+        # Only called for missing attributes, so decoding costs nothing
+        # once the pixels are loaded.
+        if name == "_image" and self.__dict__.get("_geometry") is not None:
+            self._applygeometry()
+            return self._image
+        elif name == "_image" and self.__dict__.get("_source") is not None:
+            self._decode()
+            return self._image
+
+        raise AttributeError(name)
+
+    def _decode(self):
+        """
+        Decodes the pixels of the opened file.  Converts the image to RGB
+        automatically so (r, g, b) tuples can be used everywhere.
+        """
+        image = Image.open(self._source)
+        if self._decode_size is not None:
+            image = _reduce(image, self._decode_size)
+
+        width, height = image.size
+        if self._backing in ("mmap", "tiled"):
+            array = _spillarray((height, width, 3))
+        else:
+            array = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Convert a strip at a time so only the decoded file, the array
+        # and one strip are ever in memory
+        rows = max(1, (1 << 22) // (width * 3))
+        for top, bottom, strip in _rgbstrips(image, rows):
+            array[top:bottom] = strip
+
+        if self._backing == "tiled":
+            array = _TiledArray(array)
+
+        self._image = array
+        self._source = None
+
+    def _setdecodesize(self, size=None, max_size=None):
+        """
+        Sets the size to decode the opened file at, either exactly 'size'
+        or shrunk to fit in 'max_size' (never enlarged).
+        """
+        if self._source is None:
+            raise ValueError("Picture has already been decoded")
+        elif (size is not None) and (max_size is not None):
+            raise ValueError("Can only provide one of size and max_size")
+
+        width, height = self._source_size
+        if size is None:
+            scale = min(1.0, max_size[0] / float(width), max_size[1] / float(height))
+            size = (max(1, int(round(width * scale))),
+                    max(1, int(round(height * scale))))
+
+        size = (int(size[0]), int(size[1]))
+        if size[0] < 1 or size[1] < 1:
+            msg = "Expected a size greater than zero, but got {0} instead!"
+            raise ValueError(msg.format(size))
+
+        if size != self._source_size:
+            self._decode_size = size
+            self._source_size = size
+            self._tiles = np.zeros(self._tileshape(), dtype=np.int64)
+
     @staticmethod
     def from_path(path):
         return Picture(path=path)
@@ -315,10 +1920,70 @@ class Picture(object):
     def from_size(size, color=None):
         return Picture(size=size, color=color)
 
+    @staticmethod
+    def from_buffer(buf, size):
+        """
+        Creates a picture from a buffer (bytes, bytearray, mmap, array,
+        ...) of packed RGB pixels, top row first, without copying it.
+        Changes to the picture are written into the buffer, unless it is
+        read-only, in which case the picture gets a copy when first changed.
+        """
+        width, height = size
+        array = np.frombuffer(buf, dtype=np.uint8, count=width * height * 3)
+        return Picture(array=array.reshape((height, width, 3)))
+
+    @staticmethod
+    def from_memmap(path, size=None):
+        """
+        Creates a Picture whose pixels stay in a memory-mapped file.  The
+        file is either a .npy file holding a (height, width, 3) uint8 array
+        or a raw file of RGB bytes, row by row from the top.  'size' is
+        required for raw files.  Missing files are created (black).
+        """
+        shape = None if size is None else (int(size[1]), int(size[0]), 3)
+        if path.lower().endswith(".npy") and os.path.exists(path):
+            array = np.load(path, mmap_mode="r+")
+        elif shape is None:
+            raise ValueError("Expected (width, height) size for the memory map")
+        elif path.lower().endswith(".npy"):
+            array = np.lib.format.open_memmap(path, mode="w+",
+                                              dtype=np.uint8, shape=shape)
+        else:
+            mode = "r+" if os.path.exists(path) else "w+"
+            array = np.memmap(path, dtype=np.uint8, mode=mode, shape=shape)
+
+        if array.dtype != np.uint8 or array.ndim != 3 or array.shape[2] != 3:
+            msg = "Expected a (height, width, 3) uint8 array, but got {0} {1}"
+            raise ValueError(msg.format(array.dtype, array.shape))
+
+        return Picture(array=array)
+
+    @staticmethod
+    def from_tiles(path, size=None, tile_size=256, cache_bytes=64 << 20):
+        """
+        Creates a TiledPicture over a memory-mapped file (see from_memmap).
+        The picture is split into tile_size x tile_size tiles and at most
+        'cache_bytes' worth of them are kept in memory; the least recently
+        used are written back to the file and dropped.  Call flush() to
+        write every changed tile back.
+        """
+        array = Picture.from_memmap(path, size=size)._image
+        return TiledPicture(array=_TiledArray(array, tile_size=tile_size,
+                                              cache_bytes=cache_bytes))
+
     def save(self, path):
         """Saves the picture to the given path."""
-        Image.fromarray(self._inflate(self._image)).save(path)
+        # Anything but a plain in-memory array is written a block at a time
+        streamed = self._streaminflated() or (type(self._image) is not np.ndarray)
+        if streamed and os.path.splitext(path)[1].lower() == ".png":
+            # Write (inflated) rows out as they are made
+            with io.open(path, "wb") as out_file:
+                _writepng(out_file, self._inflatedsize(), self._inflatedrows())
+        else:
+            Image.fromarray(self._inflate(self._image)).save(path)
+
         self._modified = False
+        self._saved_version = self._version
         self._path = os.path.abspath(path)
         self._format = imghdr.what(path)
 
@@ -340,19 +2005,175 @@ class Picture(object):
     @property
     def size(self):
         """Gets or sets the size of the picture with a (width, height) tuple"""
+        if self._geometry is not None:
+            return self._geometry["size"]
+        elif self._source is not None:
+            return self._source_size
+
         return (self._image.shape[1], self._image.shape[0])
 
     @size.setter
     def size(self, value):
-        if isinstance(value, tuple) and len(value) == 2:
-            # Don't resize if no change in size
-            if (value[0] != self.width) or (value[1] != self.height):
-                new_size = (int(value[0]), int(value[1]))
-                self._image = np.array(Image.fromarray(self._image).resize(new_size))
-                self._setmodified()
-        else:
+        self.resize(value)
+
+    def resize(self, size, resample="nearest"):
+        """
+        Resizes the picture to size (width, height) using the given filter:
+        "nearest" (default), "bilinear", "bicubic" or "lanczos".
+        """
+        if not (isinstance(size, tuple) and len(size) == 2):
             msg = "Expected (width, height), but got {0} instead!"
-            raise TypeError(msg.format(value))
+            raise TypeError(msg.format(size))
+
+        if resample not in _resample_filters:
+            msg = "Expected resample filter {0}, but got {1} instead!"
+            raise ValueError(msg.format(sorted(_resample_filters), resample))
+
+        new_size = (int(size[0]), int(size[1]))
+        if new_size[0] < 1 or new_size[1] < 1:
+            msg = "Expected a size greater than zero, but got {0} instead!"
+            raise ValueError(msg.format(size))
+
+        # Don't resize if no change in size
+        if new_size != self.size:
+            geometry = self._getgeometry()
+            geometry["size"] = new_size
+            geometry["resample"] = resample
+            self._changedgeometry()
+
+    def crop(self, left, bottom, right, top):
+        """
+        Crops the picture to the given bounds.  Right and top are exclusive,
+        so the result is the same as picture[left:right, bottom:top].
+        NOTE: Using Cartesian coordinate system!
+        """
+        width, height = self.size
+        if not (0 <= left < right <= width and 0 <= bottom < top <= height):
+            msg = "Expected bounds within {0}, but got {1} instead!"
+            raise ValueError(msg.format(self.size, (left, bottom, right, top)))
+
+        # Find the bounds in the (unflipped) array
+        geometry = self._getgeometry()
+        flip_x, flip_y = geometry["flip"]
+        cols = (width - right, width - left) if flip_x else (left, right)
+        rows = (bottom, top) if flip_y else (height - top, height - bottom)
+
+        # ...and then in the array before it was resized
+        x0, y0, x1, y1 = geometry["box"]
+        scale_x, scale_y = (x1 - x0) / width, (y1 - y0) / height
+        geometry["box"] = (x0 + cols[0] * scale_x, y0 + rows[0] * scale_y,
+                           x0 + cols[1] * scale_x, y0 + rows[1] * scale_y)
+        geometry["size"] = (right - left, top - bottom)
+        self._changedgeometry()
+
+    def flip(self, direction="horizontal"):
+        """
+        Flips the picture left to right ("horizontal", the default) or
+        top to bottom ("vertical").
+        """
+        if direction not in ("horizontal", "vertical"):
+            msg = "Expected 'horizontal' or 'vertical', but got {0} instead!"
+            raise ValueError(msg.format(direction))
+
+        geometry = self._getgeometry()
+        flip_x, flip_y = geometry["flip"]
+        if direction == "horizontal":
+            geometry["flip"] = (not flip_x, flip_y)
+        else:
+            geometry["flip"] = (flip_x, not flip_y)
+
+        self._changedgeometry()
+
+    @contextlib.contextmanager
+    def deferred(self):
+        """
+        Defers size, crop and flip changes made inside the 'with' block
+        until the pixels are next used, so they are applied together with
+        a single resample.
+        Example:
+            with picture.deferred():
+                picture.width = 200     # Nothing is resized yet...
+                picture.height = 100    # ...or here
+                picture.flip()
+            picture.save("small.png")   # Resized (once) and flipped here
+        """
+        self._deferring += 1
+        try:
+            yield self
+        finally:
+            self._deferring -= 1
+
+    def _getgeometry(self):
+        """
+        Gets the size, crop and flip changes not applied yet, taking the
+        pixels out of the picture (so they are applied when next used).
+        """
+        if self._geometry is None:
+            width, height = self.size
+            self._geometry = {
+                # Array to change (None if the file isn't decoded yet)
+                "image": self.__dict__.pop("_image", None),
+
+                # (left, top, right, bottom) of the array to keep
+                "box": (0.0, 0.0, float(width), float(height)),
+                "size": (width, height),
+                "flip": (False, False),
+                "resample": "nearest"
+            }
+
+        return self._geometry
+
+    def _changedgeometry(self):
+        """Records a change to the geometry, applying it unless deferred"""
+        self._setmodified()
+        if not self._deferring:
+            self._applygeometry()
+
+    def _applygeometry(self):
+        """
+        Applies the size, crop and flip changes not applied yet.  If that
+        fails, they are dropped and the picture keeps its pixels.
+        """
+        geometry = self._geometry
+        if geometry["image"] is None:
+            self._decode()
+            geometry["image"] = self.__dict__.pop("_image")
+
+        try:
+            image = self._geometryimage(geometry)
+        except Exception:
+            self._geometry = None
+            self._image = geometry["image"]
+            raise
+
+        self._geometry = None
+        self._image = image
+        self._unshare()
+
+    @staticmethod
+    def _geometryimage(geometry):
+        """Makes the array with the changes in 'geometry' applied"""
+        image = np.asarray(geometry["image"])
+        box, size = geometry["box"], geometry["size"]
+        if all(float(v).is_integer() for v in box):
+            # Cropping whole pixels doesn't need a resample
+            image = image[int(box[1]):int(box[3]), int(box[0]):int(box[2])]
+            box = None
+
+        resized = (box is not None) or (size != (image.shape[1], image.shape[0]))
+        if resized:
+            image = _resize(image, size, geometry["resample"], box=box)
+
+        flip_x, flip_y = geometry["flip"]
+        if flip_x:
+            image = image[:, ::-1]
+        if flip_y:
+            image = image[::-1]
+
+        if (not resized) or flip_x or flip_y:
+            image = np.array(image)
+
+        return image
 
     @property
     def width(self):
@@ -393,16 +2214,92 @@ class Picture(object):
 
     def _repr_png_(self):
         """Returns an Image for display in an IPython console"""
-        # Convert picture to in-memory PNG
-        data = BytesIO()
-        Image.fromarray(self._inflate(self._image)).save(data, format="png")
-        data.seek(0)
-        return data.read()
+        if _display["format"] == "png":
+            return self._displaydata()
+
+    def _repr_jpeg_(self):
+        """Returns an Image for display in an IPython console"""
+        if _display["format"] == "jpeg":
+            return self._displaydata()
+
+    def _displaydata(self):
+        """
+        Encodes the picture for display.  The result is kept until the
+        picture changes, so displaying it again costs nothing.
+        """
+        key = (self._version, id(self._image), self._inflation,
+               tuple(sorted(_display.items())))
+        if self._display_cache is None or self._display_cache[0] != key:
+            # Convert picture to in-memory PNG or JPEG
+            data = BytesIO()
+            if _display["format"] == "png" and self._streaminflated():
+                _writepng(data, self._inflatedsize(), self._inflatedrows(),
+                          compress_level=_display["compress_level"])
+            elif _display["format"] == "png":
+                image = Image.fromarray(self._inflate(self._image))
+                image.save(data, format="png",
+                           compress_level=_display["compress_level"])
+            else:
+                image = Image.fromarray(self._inflate(self._image))
+                image.save(data, format="jpeg", quality=_display["quality"])
+
+            self._display_cache = (key, data.getvalue())
+
+        return self._display_cache[1]
 
     def show(self):
         """Displays the image in a separate window"""
         return Image.fromarray(self._inflate(self._image)).show()
 
+    def to_pil(self):
+        """
+        Gets the picture as a PIL Image.  PIL keeps pixels in its own
+        layout, so they are converted (once) straight from the picture's.
+        """
+        array = np.ascontiguousarray(self._image)
+        return Image.frombuffer("RGB", self.size, array, "raw", "RGB", 0, 1)
+
+    def __array__(self, dtype=None):
+        """
+        Gets the pixels as a read-only (height, width, 3) array, top row
+        first, that shares memory with the picture.
+        """
+        array = np.asarray(self._image).view()
+        array.flags.writeable = False
+        return array if dtype is None else array.astype(dtype)
+
+    @property
+    def __array_interface__(self):
+        """Describes the pixels to NumPy (see __array__)"""
+        image = self._image
+        owner = image
+        while isinstance(owner, np.ndarray) and isinstance(owner.base, np.ndarray):
+            owner = owner.base
+
+        if not isinstance(owner, np.ndarray) or not owner.flags.c_contiguous:
+            # Not one block of memory, so NumPy falls back to __array__
+            raise AttributeError("__array_interface__")
+
+        # Arrays made from this keep the object holding their memory alive,
+        # so describe the pixels as part of a read-only view of the whole
+        # block rather than with a pointer, which would only keep the
+        # picture alive (and it may replace its pixels)
+        exported = self._exportedview()
+        if exported is None or self._exported[0]() is not owner:
+            exported = owner.view()
+            exported.flags.writeable = False
+            self._exported = (weakref.ref(owner), weakref.ref(exported))
+
+        interface = dict(image.__array_interface__)
+        interface["offset"] = (interface["data"][0] -
+                               owner.__array_interface__["data"][0])
+        interface["data"] = exported
+        return interface
+
+    def _exportedview(self):
+        """Gets the view last handed out by __array_interface__, if in use"""
+        return self._exported[1]() if self._exported is not None else None
+
     def _makepixel(self, xy):
         """
         Creates a Pixel object for a given x, y location.
@@ -411,20 +2308,296 @@ class Picture(object):
         rgb = self._image[self.height - xy[1] - 1, xy[0]]
         return Pixel(self, self._image, xy[0], xy[1], rgb)
 
-    def _setmodified(self):
+    def _setmodified(self, rows=slice(None), cols=slice(None), dim=None,
+                     keep=()):
+        """
+        Records a change to the given rows and columns of the underlying
+        array (not Cartesian coordinates), or to the whole image.
+        Call before writing so the change is tracked.  If only one
+        channel changes, 'dim' is its index.  Channels in 'keep' (those
+        read by the value being written, a block at a time) are left
+        reading the array as it changes.
+        """
+        if self._history is not None and self._history["changes"] is not None:
+            self._journal(rows, cols)
+
+        if "_image" in self.__dict__:
+            self._detachchannels(dim, keep)
+            if not _writeable(self._image) or \
+                    (len(self._sharing) > 1 and not self._detachothers(rows, cols)):
+                # Other pictures share the pixels (or they are read-only),
+                # so change a copy of them
+                self._unshare()
+                self._image = np.array(self._image)
+
         self._modified = True
         self._path = None
+        self._version += 1
+
+        if self._tiles.shape != self._tileshape():
+            # Image was replaced by one of a different size
+            self._tiles = np.empty(self._tileshape(), dtype=np.int64)
+            self._tiles[:] = self._version
+        else:
+            self._tiles[_tileslice(rows, self.height),
+                        _tileslice(cols, self.width)] = self._version
+
+    def _detachothers(self, rows, cols):
+        """
+        Gives the other pictures that share the pixels about to change
+        their own copies, if they are smaller than this picture's pixels
+        all together, so changing a big picture while small slices of it
+        are in use only copies the slices.  Pixels in a file or an outside
+        buffer are never the ones copied, since changes have to reach them.
+        Returns False, leaving every picture as it was, if this picture
+        should get the copy instead.
+        """
+        backed = _backed(self._image)
+        region = self._image[rows, cols]
+        others = []
+        for picture in self._sharing:
+            image = picture.__dict__.get("_image")
+            if image is None and picture._geometry is not None:
+                # Pixels are held until the deferred changes are applied
+                image = picture._geometry["image"]
+
+            if picture is self or image is None or \
+                    not np.may_share_memory(image, region):
+                continue
+            elif picture._exportedview() is not None and not backed:
+                # Others handed out this exact array
+                return False
+
+            others.append((picture, image))
+
+        if not backed and \
+                sum(image.size for picture, image in others) >= self._image.size:
+            return False
+
+        for picture, image in others:
+            copy = np.array(image)
+            picture._unshare()
+            if "_image" in picture.__dict__:
+                picture._image = copy
+            else:
+                picture._geometry["image"] = copy
+
+            for channel in picture._channels.values():
+                if channel._image is image:
+                    channel._image = copy
+
+        return True
+
+    def _detachchannels(self, dim=None, keep=()):
+        """
+        Gives the channels in use that read the current array (and channel
+        'dim', if given) copies of their planes, except those in 'keep'.
+        """
+        for channel in self._channels.values():
+            if channel._image is self._image and \
+                    (dim is None or channel._dim == dim) and \
+                    not any(channel is kept for kept in keep):
+                channel._detach()
+
+    def _tileshape(self):
+        """Gets the (rows, columns) of the grid of tiles covering the image"""
+        return (-(-self.height // TILE_SIZE), -(-self.width // TILE_SIZE))
+
+    def _changedtiles(self, version):
+        """Gets a boolean grid of the tiles changed since 'version'"""
+        if self._tiles.shape != self._tileshape():
+            return np.ones(self._tileshape(), dtype=bool)
+
+        return self._tiles > version
+
+    def _tilekey(self, tile_row, tile_col):
+        """Gets the (rows, columns) of the underlying array covered by a tile"""
+        return (slice(tile_row * TILE_SIZE, (tile_row + 1) * TILE_SIZE),
+                slice(tile_col * TILE_SIZE, (tile_col + 1) * TILE_SIZE))
+
+    @property
+    def dirty_region(self):
+        """
+        Gets the (left, bottom, right, top) bounds of the tiles that have
+        changed since the picture was opened or saved, or None if nothing
+        has changed.  Right and top are exclusive, so
+        picture[left:right, bottom:top] covers every changed pixel.
+        NOTE: Using Cartesian coordinate system!
+        """
+        tile_rows, tile_cols = np.nonzero(self._changedtiles(self._saved_version))
+        if len(tile_rows) == 0:
+            return None
+
+        top_row = tile_rows.min() * TILE_SIZE
+        bottom_row = min((tile_rows.max() + 1) * TILE_SIZE, self.height)
+        left = tile_cols.min() * TILE_SIZE
+        right = min((tile_cols.max() + 1) * TILE_SIZE, self.width)
+
+        return (int(left), int(self.height - bottom_row),
+                int(right), int(self.height - top_row))
+
+    def quantize_to_named_colors(self, palette=None):
+        """
+        Replaces every pixel with the closest named color (see
+        nearest_color_name).  Each distinct color in the picture is only
+        looked up once.
+        """
+        index = _colorindex(palette)
+        image = np.asarray(self._image)
+        keys = (image[:, :, 0].astype(np.int32) << 16) | \
+            (image[:, :, 1].astype(np.int32) << 8) | image[:, :, 2]
+
+        keys, inverse = np.unique(keys, return_inverse=True)
+        colors = np.column_stack(((keys >> 16) & 0xFF, (keys >> 8) & 0xFF,
+                                  keys & 0xFF))
+        nearest = index.rgb[index.nearest(colors)].astype(np.uint8)
+
+        self._setmodified()
+        self._image[:, :] = nearest[inverse].reshape(image.shape)
+
+    def checkpoint(self):
+        """
+        Remembers the picture as it is now, so later changes can be undone
+        with undo().  Only the tiles that change after the checkpoint are
+        kept (compressed), not the whole picture.
+        """
+        self._image  # Applies any deferred size changes
+        if self._history is None:
+            self._history = { "undo": [], "redo": [], "changes": None }
+        elif _haschanges(self._history["changes"]):
+            self._history["undo"].append(self._history["changes"])
+
+        self._history["changes"] = { "image": None, "tiles": {} }
+
+    def undo(self):
+        """
+        Undoes the changes made since the last checkpoint, or if there
+        are none, since the checkpoint before it.  Returns False if there
+        is nothing to undo.
+        """
+        if self._history is None:
+            return False
+
+        self._image  # Applies any deferred size changes
+        changes = self._history["changes"]
+        if not _haschanges(changes):
+            if not self._history["undo"]:
+                return False
+
+            changes = self._history["undo"].pop()
+
+        self._history["redo"].append(self._restore(changes))
+        self._history["changes"] = { "image": None, "tiles": {} }
+        return True
+
+    def redo(self):
+        """
+        Redoes the changes that were last undone.  Returns False if there
+        is nothing to redo (changes made after undo() can't be redone).
+        """
+        if self._history is None or not self._history["redo"]:
+            return False
+
+        self._image  # Applies any deferred size changes
+        changes = self._history["redo"].pop()
+        self._history["undo"].append(self._restore(changes))
+        self._history["changes"] = { "image": None, "tiles": {} }
+        return True
+
+    def _journal(self, rows, cols):
+        """Saves the tiles about to change so they can be restored (undo)"""
+        changes = self._history["changes"]
+        if changes["image"] is not None:
+            # Saved all of the picture already
+            return
+        elif not _haschanges(changes):
+            # Changes after an undo replace what could be redone
+            del self._history["redo"][:]
+
+        if self._geometry is not None:
+            # Resizing, cropping or flipping: save the picture before it
+            image = self._geometry["image"]
+            if image is None:
+                self._decode()
+                image = self._geometry["image"] = self.__dict__.pop("_image")
+
+            changes["image"] = _compresstile(image)
+            return
+
+        image = self._image
+        tile_rows = _tileslice(rows, self.height)
+        tile_cols = _tileslice(cols, self.width)
+        for tile_row in xrange(tile_rows.start, tile_rows.stop):
+            for tile_col in xrange(tile_cols.start, tile_cols.stop):
+                tile = (tile_row, tile_col)
+                if tile not in changes["tiles"]:
+                    key = self._tilekey(tile_row, tile_col)
+                    changes["tiles"][tile] = _compresstile(image[key])
+
+    def _restore(self, changes):
+        """
+        Puts back saved tiles (see _journal), returning the tiles they
+        replaced so the restore can be reversed.
+        """
+        history, self._history = self._history, None
+        try:
+            if changes["image"] is not None:
+                reverse = { "image": _compresstile(self._image), "tiles": {} }
+                self._image = _decompresstile(changes["image"])
+                self._unshare()
+            else:
+                reverse = { "image": None, "tiles": {} }
+                for tile in changes["tiles"]:
+                    key = self._tilekey(*tile)
+                    reverse["tiles"][tile] = _compresstile(self._image[key])
+
+            self._setmodified()
+            for tile, data in changes["tiles"].items():
+                self._image[self._tilekey(*tile)] = _decompresstile(data)
+        finally:
+            self._history = history
+
+        return reverse
 
     def _getdim(self, dim):
         return self._image[:, :, dim]
 
     def _setdim(self, dim, value):
-        self._image[:, :, dim] = value
+        # The value is computed a block at a time, each before its rows are
+        # written, so it can read the channels being changed
+        keep = list(value._channels()) if isinstance(value, _Expression) else ()
+        self._setmodified(dim=None if isinstance(dim, slice) else dim, keep=keep)
+        image = self._image
+        width, height = self.size
+        if not isinstance(value, _Expression):
+            value = np.asarray(value)
+            if not isinstance(dim, slice) and value.shape == (width * height,):
+                # Flat arrays (like pic.red) have a value for every pixel
+                # of one channel
+                value = value.reshape((height, width))
+
+        def set_strip(top, bottom):
+            for block_top, block_bottom in _blocks(top, bottom, width):
+                if isinstance(value, _Expression):
+                    block = value._evaluate(block_top, block_bottom)
+                elif value.ndim >= 2:
+                    # Arrays with rows are split into blocks with the image
+                    block = value[block_top:block_bottom]
+                else:
+                    block = value
+
+                # Saturate instead of wrapping around
+                if block.dtype != np.uint8 and block.dtype.kind in "iuf":
+                    block = np.clip(block, 0, 255)
+
+                image[block_top:block_bottom, :, dim] = block
+
+        _runstrips(set_strip, height, isinstance(image, np.ndarray))
 
     @property
     def red(self):
         """Gets or sets the red component"""
-        return self._getdim(0).ravel()
+        return _Channel(self, 0)
 
     @red.setter
     def red(self, value):
@@ -433,7 +2606,7 @@ class Picture(object):
     @property
     def green(self):
         """Gets or sets the green component"""
-        return self._getdim(1).ravel()
+        return _Channel(self, 1)
 
     @green.setter
     def green(self, value):
@@ -442,7 +2615,7 @@ class Picture(object):
     @property
     def blue(self):
         """Gets or sets the blue component"""
-        return self._getdim(2).ravel()
+        return _Channel(self, 2)
 
     @blue.setter
     def blue(self, value):
@@ -459,22 +2632,227 @@ class Picture(object):
         self._setdim(slice(None), value)
 
     def copy(self):
-        return Picture.from_array(self._image.copy())
+        """
+        Copies the picture.  The copy shares pixels with the picture until
+        either one is changed, so copies cost almost nothing until then.
+        """
+        if isinstance(self._image, _TiledArray):
+            # Only the tiles that change are copied
+            return TiledPicture(array=self._image.copy())
+
+        return self._share(self._image)
+
+    def _share(self, array):
+        """
+        Creates a Picture of (part of) this picture's array.  When one of
+        the pictures changes pixels the others share, either it or those
+        others get a copy, whichever copies less.
+        """
+        picture = Picture(array=array)
+        picture._sharing = self._sharing
+        self._sharing.add(picture)
+        return picture
+
+    def _unshare(self):
+        """Stops sharing pixels with other pictures"""
+        self._sharing.discard(self)
+        self._sharing = weakref.WeakSet([self])
+
+    def __getstate__(self):
+        # Pickled pictures get their own pixels when unpickled, and leave
+        # out what only this process uses
+        state = self.__dict__.copy()
+        for name in ("_sharing", "_channels", "_exported", "_inflated",
+                     "_display_cache"):
+            del state[name]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._sharing = weakref.WeakSet([self])
+        self._channels = weakref.WeakValueDictionary()
+        self._exported = None
+        self._inflated = None
+        self._display_cache = None
 
     def _inflate(self, img):
-        """Returns resized image using inflation factor (nearest neighbor)"""
-        if self._inflation == 1:
+        """
+        Returns resized image using inflation factor (nearest neighbor).
+        The result is kept in a buffer that is reused until the picture
+        changes, so it must not be modified.
+        """
+        factor = self._inflation
+        key = (self._version, id(img), factor)
+        img = np.asarray(img)
+        if factor == 1:
             return img
 
-        new_size = (int(self.width * self._inflation),
-            int(self.height * self._inflation))
-        return np.array(Image.fromarray(img).resize(new_size))
+        if self._inflated is not None:
+            if self._inflated[0] == key:
+                return self._inflated[1]
+
+            buffer = self._inflated[1]
+            self._inflated = None
+        else:
+            buffer = None
+
+        height, width = img.shape[:2]
+        shape = (height * factor, width * factor, 3)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+
+        # Each source pixel fills a factor x factor block of the buffer
+        blocks = buffer.reshape(height, factor, width, factor, 3)
+        blocks[...] = img[:, np.newaxis, :, np.newaxis]
+
+        self._inflated = (key, buffer)
+        return buffer
+
+    def _inflatedsize(self):
+        """Gets the (width, height) of the picture after inflation"""
+        return (self.width * self._inflation, self.height * self._inflation)
+
+    def _streaminflated(self):
+        """True if the inflated picture is too big to build all at once"""
+        width, height = self._inflatedsize()
+        return (self._inflation > 1) and (width * height > _STREAM_PIXELS)
+
+    def _inflatedrows(self):
+        """Yields blocks of inflated rows from top to bottom"""
+        factor = self._inflation
+        row_bytes = self.width * factor * factor * 3
+        rows = max(1, (1 << 22) // row_bytes)
+        for start in xrange(0, self.height, rows):
+            block = self._image[start:start + rows]
+            yield block.repeat(factor, axis=0).repeat(factor, axis=1)
 
     def __iter__(self):
-        """Iterates over all pixels in the image"""
+        """
+        Iterates over all pixels in the image, row by row, reusing one
+        Pixel (see pixels).
+        """
+        return self.pixels()
+
+    def pixels(self, order="rows"):
+        """
+        Iterates over all pixels in the image, either row by row from the
+        bottom (order="rows", the fastest) or column by column from the
+        left (order="columns").  The same Pixel is reused for every
+        location, so list(picture) or max(picture, key=...) only give the
+        last location; use picture[pixel.x, pixel.y] to keep one.  Changes
+        to the Pixel are written to the picture a row at a time.
+        """
+        if order == "rows":
+            locations = ((x, y) for y in xrange(self.height)
+                         for x in xrange(self.width))
+        elif order == "columns":
+            locations = ((x, y) for x in xrange(self.width)
+                         for y in xrange(self.height))
+        else:
+            msg = "Expected order to be 'rows' or 'columns', but got {0} instead!"
+            raise ValueError(msg.format(order))
+
+        cursor = _PixelCursor(self)
+        try:
+            for x, y in locations:
+                cursor._moveto(x, y)
+                yield cursor
+        finally:
+            cursor._flush()
+
+    def _view(self, rows, cols, writable):
+        """Returns a view of part of the image, read-only unless writable"""
+        if writable:
+            self._setmodified(rows, cols)
+
+        view = self._image[rows, cols]
+        if not writable:
+            view.flags.writeable = False
+
+        return view
+
+    def rows(self, writable=False):
+        """
+        Iterates over the rows of the picture from bottom to top.  Each row
+        is a NumPy array of (r, g, b) values ordered from left to right that
+        shares memory with the picture.  Rows are read-only unless
+        'writable' is True.
+        NOTE: Using Cartesian coordinate system!
+        """
+        for y in xrange(self.height):
+            yield self._view(self.height - y - 1, slice(None), writable)
+
+    def columns(self, writable=False):
+        """
+        Iterates over the columns of the picture from left to right.  Each
+        column is a NumPy array of (r, g, b) values ordered from bottom to
+        top that shares memory with the picture.  Columns are read-only
+        unless 'writable' is True.
+        NOTE: Using Cartesian coordinate system!
+        """
         for x in xrange(self.width):
-            for y in xrange(self.height):
-                yield self._makepixel((x, y))
+            yield self._view(slice(None, None, -1), x, writable)
+
+    def iter_chunks(self, rows=64, columns=None):
+        """
+        Iterates over the picture in blocks of pixels, starting at the
+        bottom-left corner.  Each block is a PixelBatch covering 'rows'
+        rows and 'columns' columns (default: the full width).
+        NOTE: Using Cartesian coordinate system!
+        """
+        if columns is None:
+            columns = self.width
+
+        if rows < 1 or columns < 1:
+            raise ValueError("Expected chunk rows and columns greater than zero")
+
+        for y0 in xrange(0, self.height, rows):
+            y1 = min(y0 + rows, self.height)
+            for x0 in xrange(0, self.width, columns):
+                x1 = min(x0 + columns, self.width)
+                yield PixelBatch(self, x0, y0, x1, y1)
+
+    def vectorize(self, fn):
+        """
+        Calls fn(pixel) for every pixel, like
+
+            for pixel in picture:
+                fn(pixel)
+
+        but runs fn on whole arrays of pixels where it can.  Conditions on
+        pixel values become masks and assignments to red, green, blue or
+        rgb become masked array updates.  Functions that cannot be traced
+        this way (e.g. ones that call int() or look at other pixels) are
+        run one pixel at a time instead.
+
+        NOTE: fn may be called several times while tracing, so it should
+        not do anything besides reading and setting pixel values.
+        """
+        rows = max(1, (1 << 18) // max(1, self.width))
+        traceable = True
+        for batch in self.iter_chunks(rows=rows):
+            if traceable:
+                shape = batch.x.shape
+                tracer = _Tracer(batch.x.ravel(), batch.y.ravel(),
+                                 [c.ravel() for c in batch.rgb])
+                try:
+                    rgb, wrote = tracer.run(fn)
+                except _Untraceable:
+                    traceable = False
+                else:
+                    if wrote:
+                        batch.rgb = tuple(c.reshape(shape) for c in rgb)
+                    continue
+
+            # Fall back to calling fn on each pixel
+            cursor = _PixelCursor(self)
+            for y in xrange(batch._y0, batch._y1):
+                for x in xrange(batch._x0, batch._x1):
+                    cursor._moveto(x, y)
+                    fn(cursor)
+
+            cursor._flush()
 
     def _verify_key(self, key):
         if isinstance(key, tuple) and len(key) == 2:
@@ -526,32 +2904,404 @@ class Picture(object):
         if isinstance(key[0], int) and isinstance(key[1], int):
             # Single pixel
             return self._makepixel((key[0], key[1]))
+        elif isinstance(self._image, np.ndarray):
+            # Shares pixels with this picture until either one is changed
+            return self._share(self._image[key[1], key[0]])
         else:
-            sliced_array = self._image[key[1], key[0]]
-            return Picture.from_array(sliced_array)
+            return Picture.from_array(self._image[key[1], key[0]])
 
     def __setitem__(self, key, value):
         """
-        Sets pixel values using 2D int or slice notations.
+        Sets pixel values using 2D int or slice notations, or a mask.
         Examples:
             pic[0, 0] = (0, 0, 0)               # Make bottom-left pixel black
             pic[:, pic.height-1] = (255, 0, 0)  # Make top row red
             pic[::2, ::2] = (255, 255, 255)     # Make every other pixel white
+            pic[pic.red > 128] = "red"          # Make reddish pixels red
+
+        Values can be a color, another Picture or an array of colors laid
+        out like the picture's pixels (top row first).  Masks are boolean
+        arrays with a value for every pixel, like the ones made by
+        comparing pic.red, pic.green or pic.blue.
         """
         if isinstance(key, tuple) and len(key) == 2:
-            if isinstance(value, Picture):
-                # value is another Picture
-                src_key = self._verify_key(key)
-                self._image[src_key[1], src_key[0]] = value._image
+            src_key = self._verify_key(key)
+            if isinstance(src_key[0], int) and isinstance(src_key[1], int):
+                rows, cols = self.height - src_key[1] - 1, src_key[0]
             else:
-                # Assume value is a color
-                self[key[0], key[1]].rgb = value
-
-            self._setmodified()
+                rows, cols = src_key[1], src_key[0]
+
+            value = self._colorvalue(value)
+            self._setmodified(rows, cols)
+            self._image[rows, cols] = value
+        elif isinstance(key, _Expression) or \
+                (isinstance(key, np.ndarray) and key.dtype == bool):
+            mask = self._verify_mask(np.asarray(key))
+            if mask.dtype != bool:
+                msg = "Expected a boolean mask, but got {0} values instead!"
+                raise TypeError(msg.format(mask.dtype))
+
+            value = self._colorvalue(value)
+            if isinstance(value, np.ndarray) and value.ndim >= 2 and \
+                    value.shape[:-1] in (mask.shape, (mask.size,)):
+                # One color for every pixel, of which only some are set
+                value = value.reshape(mask.shape + (3,))[mask]
+
+            # Only the rows and columns with set pixels have changed
+            rows = np.flatnonzero(mask.any(axis=1))
+            cols = np.flatnonzero(mask.any(axis=0))
+            if len(rows) > 0:
+                self._setmodified(slice(rows[0], rows[-1] + 1),
+                                  slice(cols[0], cols[-1] + 1))
+                self._image[mask] = value
         else:
             raise TypeError("Invalid key type")
 
+    def _colorvalue(self, value):
+        """
+        Converts a value for __setitem__ to an array of colors, or an RGB
+        tuple for a single color
+        """
+        if isinstance(value, Picture):
+            return np.asarray(value._image)
+        elif isinstance(value, np.ndarray) and value.ndim >= 2:
+            if value.dtype.kind in "biuf" and value.size > 0 and \
+                    (value.min() < 0 or value.max() > 255):
+                raise ValueError("Expected RGB values from 0 to 255")
+
+            return value
+        else:
+            # Single color
+            rgb = _parse_color(value)
+            if min(rgb) < 0 or max(rgb) > 255:
+                raise ValueError("Expected RGB values from 0 to 255")
+
+            return rgb
+
+    def _verify_mask(self, mask):
+        """Checks a mask has a value for every pixel, giving it 2 dimensions"""
+        shape = (self.height, self.width)
+        if mask.shape == shape:
+            return mask
+        elif mask.shape == (mask.size,) and mask.size == self.width * self.height:
+            return mask.reshape(shape)
+        else:
+            msg = "Expected a mask of {0} pixels, but got shape {1} instead!"
+            raise IndexError(msg.format(self.width * self.height, mask.shape))
+
     def __repr__(self):
         return "Picture (format: {0}, path: {1}, modified: {2})"\
             .format(self.format, self.path, self.modified)
 
+# ----------------------------------------------------------------------------
+
+def _axisruns(index, length, tile_size):
+    """
+    Splits an int or slice along one axis into runs that each stay within
+    one tile.  Returns (count, runs) where each run is
+    (tile, slice of the result, slice within the tile).
+    """
+    if isinstance(index, slice):
+        indices = np.arange(*index.indices(length))
+    else:
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Index out of bounds")
+        indices = np.array([index])
+
+    runs = []
+    if len(indices) == 0:
+        return 0, runs
+
+    tiles = indices // tile_size
+    breaks = [0] + list(np.flatnonzero(np.diff(tiles)) + 1) + [len(indices)]
+    for start, stop in zip(breaks[:-1], breaks[1:]):
+        tile = int(tiles[start])
+        local = indices[start:stop] - (tile * tile_size)
+        step = int(local[1] - local[0]) if len(local) > 1 else 1
+        end = int(local[-1]) + step
+        runs.append((tile, slice(start, stop),
+                     slice(int(local[0]), end if end >= 0 else None, step)))
+
+    return len(indices), runs
+
+class _TiledArray(object):
+    """
+    A (height, width, 3) uint8 array kept as square tiles, of which only
+    the most recently used are held in memory.  Tiles are copied from
+    'source' (usually a memory-mapped file) when first needed and changed
+    tiles are written back when dropped, so pictures much bigger than
+    memory can be used a region at a time.  Supports indexing with ints
+    and slices like an ndarray, and setting the pixels picked by a
+    (height, width) boolean mask; anything else reads the whole array.
+
+    Copies (see copy) read the tiles they haven't changed from the array
+    they were copied from, which hands them its old tiles before writing
+    over them, so only tiles that change are ever duplicated.
+    """
+    ndim = 3
+
+    @property
+    def dtype(self):
+        return np.dtype(np.uint8)
+
+    def __init__(self, source, tile_size=256, cache_bytes=64 << 20):
+        self.shape = source.shape
+        self._source = source
+        self._tile_size = tile_size
+        self._max_tiles = max(1, cache_bytes // (tile_size * tile_size * 3))
+
+        # Least recently used tiles first
+        self._tiles = collections.OrderedDict()
+        self._dirty = set()
+
+        # Copies read the tiles that aren't in their own source ('owned',
+        # None for all of them) from their parent
+        self._parent = None
+        self._owned = None
+        self._children = weakref.WeakSet()
+
+    def _tilekey(self, tile):
+        size = self._tile_size
+        return (slice(tile[0] * size, (tile[0] + 1) * size),
+                slice(tile[1] * size, (tile[1] + 1) * size))
+
+    def _gettile(self, tile):
+        """Gets a tile, reading it from the source if it is not cached"""
+        array = self._tiles.pop(tile, None)
+        if array is None:
+            while len(self._tiles) >= self._max_tiles:
+                self._evict()
+
+            array = np.array(self._readtile(tile), dtype=np.uint8)
+
+        self._tiles[tile] = array
+        return array
+
+    def _readtile(self, tile):
+        """Reads a tile from the source (or the parent's, for copies)"""
+        if self._owned is None or tile in self._owned:
+            return self._source[self._tilekey(tile)]
+
+        return self._parent._readtile(tile)
+
+    def _writetile(self, tile, array):
+        """Writes a tile to the source, first giving copies the old tile"""
+        children = [c for c in self._children
+                    if c._owned is not None and tile not in c._owned]
+        if children:
+            old = np.array(self._readtile(tile))
+            for child in children:
+                child._writetile(tile, old)
+
+        if self._source is None:
+            # Sparse file, so tiles that are never written take no space
+            self._source = _spillarray(self.shape)
+
+        self._source[self._tilekey(tile)] = array
+        if self._owned is not None:
+            self._owned.add(tile)
+
+    def _evict(self):
+        """Drops the least recently used tile, writing it back if changed"""
+        tile, array = self._tiles.popitem(last=False)
+        if tile in self._dirty:
+            self._writetile(tile, array)
+            self._dirty.discard(tile)
+
+    def flush(self):
+        """Writes every changed tile back to the source"""
+        for tile in self._dirty:
+            self._writetile(tile, self._tiles[tile])
+
+        self._dirty.clear()
+        if hasattr(self._source, "flush"):
+            self._source.flush()
+
+    def __del__(self):
+        # Changed tiles still in memory would be lost, leaving the file
+        # half updated (copies only have temporary files)
+        if self._dirty and self._parent is None:
+            self.flush()
+
+    def __getstate__(self):
+        # Pickled arrays get all of their pixels, and no parent or copies
+        state = self.__dict__.copy()
+        state.update(_source=np.asarray(self), _tiles=collections.OrderedDict(),
+                     _dirty=set(), _parent=None, _owned=None)
+        del state["_children"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._children = weakref.WeakSet()
+
+    def _parsekey(self, key):
+        """
+        Splits a key into (rows, columns, channels), or returns None if
+        it is not made of ints and slices.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        key = key + (slice(None),) * (3 - len(key))
+        if len(key) != 3 or not all(isinstance(k, (numbers.Integral, slice))
+                                    for k in key):
+            return None
+
+        return key
+
+    def _runs(self, rows, cols):
+        """Gets the result shape and the tiles covered by rows and columns"""
+        num_rows, row_runs = _axisruns(rows, self.shape[0], self._tile_size)
+        num_cols, col_runs = _axisruns(cols, self.shape[1], self._tile_size)
+        runs = [((tile_row, tile_col), (row_out, col_out), (row_in, col_in))
+                for tile_row, row_out, row_in in row_runs
+                for tile_col, col_out, col_in in col_runs]
+
+        return (num_rows, num_cols), runs
+
+    def __getitem__(self, key):
+        parsed = self._parsekey(key)
+        if parsed is None:
+            return np.asarray(self)[key]
+
+        rows, cols, channels = parsed
+        shape, runs = self._runs(rows, cols)
+        result = np.empty(shape + (3,), dtype=np.uint8)
+        for tile, result_key, tile_key in runs:
+            result[result_key] = self._gettile(tile)[tile_key]
+
+        # Drop the axes that were indexed with ints
+        return result[(slice(None) if isinstance(rows, slice) else 0,
+                       slice(None) if isinstance(cols, slice) else 0,
+                       channels)]
+
+    def _setmasked(self, mask, value):
+        """
+        Sets the pixels picked by a boolean mask to one color, or to one
+        color per picked pixel (top row first), a tile at a time.
+        """
+        value = np.asarray(value)
+        if value.ndim >= 2:
+            # Where each pixel's color is in value
+            positions = (np.cumsum(mask.ravel()) - 1).reshape(mask.shape)
+
+        size = self._tile_size
+        tiles = [(row // size, col // size)
+                 for row in xrange(0, self.shape[0], size)
+                 for col in xrange(0, self.shape[1], size)]
+
+        for tile in tiles:
+            tile_key = self._tilekey(tile)
+            tile_mask = mask[tile_key]
+            if tile_mask.any():
+                if value.ndim >= 2:
+                    tile_value = value[positions[tile_key][tile_mask]]
+                else:
+                    tile_value = value
+
+                self._gettile(tile)[tile_mask] = tile_value
+                self._dirty.add(tile)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, np.ndarray) and key.dtype == bool and \
+                key.shape == self.shape[:2]:
+            return self._setmasked(key, value)
+
+        parsed = self._parsekey(key)
+        if parsed is None:
+            raise IndexError("Tiled pictures only support int and slice "
+                             "indices and pixel masks")
+
+        rows, cols, channels = parsed
+        shape, runs = self._runs(rows, cols)
+
+        # Give the value the same axes as the full (rows, columns, channels)
+        # block, then broadcast it over the block without copying
+        value = np.asarray(value)
+        if not isinstance(channels, slice):
+            channels = slice(channels, channels + 1)
+            value = value[..., np.newaxis]
+        if not isinstance(cols, slice) and value.ndim >= 2:
+            value = np.expand_dims(value, -2)
+        if not isinstance(rows, slice) and value.ndim >= 3:
+            value = np.expand_dims(value, -3)
+
+        shape += np.empty(3)[channels].shape
+        block = np.lib.stride_tricks.as_strided(np.zeros(1, dtype=bool),
+                                                shape=shape, strides=(0, 0, 0))
+        value = np.broadcast_arrays(value, block)[0]
+
+        for tile, value_key, tile_key in runs:
+            self._gettile(tile)[tile_key + (channels,)] = value[value_key]
+            self._dirty.add(tile)
+
+    def __array__(self, dtype=None):
+        array = self[:, :]
+        return array if dtype is None else array.astype(dtype)
+
+    def copy(self):
+        """Makes a copy that shares unchanged tiles with this array"""
+        self.flush()
+        array = _TiledArray(self, tile_size=self._tile_size,
+                            cache_bytes=self._max_tiles * self._tile_size ** 2 * 3)
+        array._source = None
+        array._parent = self
+        array._owned = set()
+        self._children.add(array)
+        return array
+
+    def __len__(self):
+        return self.shape[0]
+
+class TiledPicture(Picture):
+    """
+    A Picture whose pixels are split into tiles, of which only the most
+    recently used stay in memory.  Reading or changing part of the
+    picture only touches the tiles that overlap it.  Changed tiles are
+    written back to the file behind the picture when they are dropped,
+    on flush() and save(), and when the picture is no longer used.
+    """
+
+    def save(self, path):
+        """Saves the picture to the given path, then flushes it"""
+        Picture.save(self, path)
+        self.flush()
+
+    def _copies(self, keys, writable):
+        """Yields copies of parts of the image, writing back changes"""
+        for rows, cols in keys:
+            array = self._image[rows, cols]
+            if not writable:
+                array.flags.writeable = False
+
+            yield array
+
+            if writable:
+                self._setmodified(rows, cols)
+                self._image[rows, cols] = array
+
+    def rows(self, writable=False):
+        """
+        Iterates over the rows of the picture from bottom to top (see
+        Picture.rows).  Rows are copies; changes to writable rows are
+        written back when the next row is requested.
+        """
+        keys = ((self.height - y - 1, slice(None)) for y in xrange(self.height))
+        return self._copies(keys, writable)
+
+    def columns(self, writable=False):
+        """
+        Iterates over the columns of the picture from left to right (see
+        Picture.columns).  Columns are copies; changes to writable columns
+        are written back when the next column is requested.
+        """
+        keys = ((slice(None, None, -1), x) for x in xrange(self.width))
+        return self._copies(keys, writable)
+
+    def flush(self):
+        """Writes every changed tile back to the file behind the picture"""
+        if isinstance(self._image, _TiledArray):
+            self._image.flush()
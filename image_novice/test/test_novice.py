@@ -5,14 +5,20 @@
 :license: modified BSD
 """
 
-import os, tempfile
+import os, sys, json, pickle, shutil, tempfile, subprocess
 import numpy as np
-from image_novice import novice
+from io import BytesIO
+from PIL import Image
+from image_novice import novice, colors
 from numpy.testing import TestCase, assert_equal, assert_raises, assert_allclose
 
 def _array_2d_to_RGB(array):
     return np.tile(array[:, :, np.newaxis], (1, 1, 3))
 
+def _blacken_corner(picture):
+    picture[:5, :5] = "black"
+    return picture.size
+
 class TestNovice(TestCase):
     sample_path = "sample.png"
     small_sample_path = "block.png"
@@ -233,3 +239,841 @@ class TestNovice(TestCase):
         for p in pic:
             assert_equal(p.rgb, (23, 47, 99))
 
+
+    def test_iter_chunks(self):
+        pic = novice.open(self.small_sample_path)
+        expected = pic.copy()
+        for p in expected:
+            if p.red > 128:
+                p.red /= 2
+
+        num_pixels = 0
+        for batch in pic.iter_chunks(rows=3, columns=4):
+            num_pixels += batch.red.size
+            red = batch.red
+            red[red > 128] /= 2
+            batch.red = red
+
+        assert_equal(num_pixels, pic.width * pic.height)
+        assert_equal(pic._image, expected._image)
+        assert pic.modified
+
+        batch = next(pic.iter_chunks(rows=2))
+        assert_equal(batch.x[0], np.arange(pic.width))
+        assert_equal(batch.y[:, 0], (0, 1))
+        batch.rgb = "#AABBCC"
+        assert_equal(pic[0, 1].rgb, (170, 187, 204))
+        assert_raises(ValueError, setattr, batch, "green", 256)
+
+    def test_vectorize(self):
+        def darken(pixel):
+            if (pixel.red > 128) and (pixel.x < 10):
+                pixel.red /= 2
+            elif pixel.green < 50 or pixel.y == 3:
+                pixel.rgb = (pixel.blue, 0, min(pixel.red * 1.5, 255))
+            else:
+                pixel.green = 255 - pixel.green
+
+        def darken_int(pixel):
+            # int() needs a concrete value, so this cannot be traced
+            if int(pixel.red) > 128:
+                pixel.red /= 2
+
+        for fn in (darken, darken_int):
+            pic = novice.open(self.small_sample_path)
+            expected = pic.copy()
+            for p in expected:
+                fn(p)
+
+            pic.vectorize(fn)
+            assert_equal(pic._image, expected._image)
+            assert pic.modified
+
+        pic = novice.open(self.small_sample_path)
+        pic.vectorize(lambda p: p.red > 128)
+        assert not pic.modified
+
+        tracer = novice._Tracer(np.arange(3), np.zeros(3), [np.arange(3)] * 3)
+        assert_raises(novice._Untraceable, tracer.run, darken_int)
+
+    def test_pixel_cursor(self):
+        pic = novice.new((4, 3), color=(10, 20, 30))
+        assert not hasattr(pic[0, 0], "__dict__")
+
+        for p in pic:
+            p.red = p.x
+            p.green = p.y
+            p.blue /= 2
+            if p.x == 2 and p.y == 1:
+                break
+
+        assert pic.modified
+        assert_equal(pic[2, 1].rgb, (2, 1, 15))
+        assert_equal(pic[3, 1].rgb, (10, 20, 30))
+        assert_equal(pic[3, 0].rgb, (3, 0, 15))
+
+        # Changes are written a row at a time, in either order
+        pic = novice.new((3, 2))
+        for p in pic.pixels(order="columns"):
+            if p.x != 1:
+                p.rgb = (p.x, p.y, 7)
+        assert_equal(pic._image[:, :, 2], [[7, 0, 7], [7, 0, 7]])
+        assert_equal(pic[2, 1].rgb, (2, 1, 7))
+        assert_equal(pic.dirty_region, (0, 0, 3, 2))
+
+        # Pixels are read from the picture's array after it is copied on write
+        pic = novice.new((2, 1), color=(10, 20, 30))
+        copy = pic.copy()
+        colors = []
+        for p in pic:
+            colors.append(p.rgb)
+            pic[1, 0] = "white"
+        assert_equal(colors, [(10, 20, 30), (255, 255, 255)])
+        assert_equal(copy[1, 0].rgb, (10, 20, 30))
+
+    def test_iteration_order(self):
+        pic = novice.new((3, 2))
+        locations = [(p.x, p.y) for p in pic]
+        assert_equal(locations, [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1)])
+
+        locations = [(p.x, p.y) for p in pic.pixels(order="columns")]
+        assert_equal(locations, [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)])
+        assert_raises(ValueError, lambda: list(pic.pixels(order="diagonal")))
+
+    def test_rows_and_columns(self):
+        pic = novice.open(self.small_sample_path)
+        for y, row in enumerate(pic.rows()):
+            assert_equal(row.shape, (pic.width, 3))
+            assert_equal(row[3], pic[3, y].rgb)
+            assert_raises(ValueError, row.__setitem__, 0, (0, 0, 0))
+
+        for x, column in enumerate(pic.columns()):
+            assert_equal(column.shape, (pic.height, 3))
+            assert_equal(column[2], pic[x, 2].rgb)
+
+        assert not pic.modified
+        for row in pic.rows(writable=True):
+            row[:, 0] = 255 - row[:, 0]
+
+        assert pic.modified
+        assert_equal(pic[1, 2].red, 255 - novice.open(self.small_sample_path)[1, 2].red)
+
+    def test_dirty_region(self):
+        pic = novice.new((200, 150))
+        assert_equal(pic.dirty_region, None)
+
+        pic[70, 10] = (255, 0, 0)
+        assert_equal(pic.dirty_region, (64, 0, 128, 22))
+
+        pic[150:160, 140:] = (0, 255, 0)
+        assert_equal(pic.dirty_region, (64, 0, 192, 150))
+        assert_equal(pic._changedtiles(0).sum(), 2)
+
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            pic.save(tmp.name)
+
+        assert_equal(pic.dirty_region, None)
+        version = pic._version
+        pic.red = 10
+        assert_equal(pic._changedtiles(version).all(), True)
+
+        pic.size = (20, 20)
+        assert_equal(pic.dirty_region, (0, 0, 20, 20))
+
+    def test_display_cache(self):
+        pic = novice.open(self.small_sample_path)
+        data = pic._repr_png_()
+        assert data.startswith(b"\x89PNG")
+        assert pic._repr_png_() is data
+        assert pic._repr_jpeg_() is None
+
+        pic.inflation = 2
+        inflated = pic._repr_png_()
+        assert inflated is not data
+
+        pic[0, 0] = (1, 2, 3)
+        assert pic._repr_png_() is not inflated
+
+        try:
+            novice.set_display(format="jpeg", quality=50)
+            assert pic._repr_png_() is None
+            assert pic._repr_jpeg_().startswith(b"\xff\xd8")
+        finally:
+            novice.set_display()
+
+        assert_raises(ValueError, novice.set_display, format="gif")
+
+    def test_inflation(self):
+        pic = novice.open(self.small_sample_path)
+        pic.inflation = 3
+        expected = pic._image.repeat(3, axis=0).repeat(3, axis=1)
+
+        inflated = pic._inflate(pic._image)
+        assert_equal(inflated, expected)
+        assert pic._inflate(pic._image) is inflated
+
+        pic[0, 0] = (1, 2, 3)
+        assert_equal(pic._inflate(pic._image)[-3:, :3], [[(1, 2, 3)] * 3] * 3)
+
+        stream_pixels = novice._STREAM_PIXELS
+        novice._STREAM_PIXELS = 0
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+                pic.save(tmp.name)
+                saved = novice.open(tmp.name)
+                assert_equal(saved.format, "png")
+                assert_equal(saved._image, pic._inflate(pic._image))
+
+            png = novice.Picture(image=Image.open(BytesIO(pic._repr_png_())))
+            assert_equal(png._image, saved._image)
+        finally:
+            novice._STREAM_PIXELS = stream_pixels
+
+    def test_lazy_open(self):
+        pic = novice.open(self.sample_path)
+        assert_equal(pic.size, (665, 500))
+        assert_equal(pic.format, "png")
+        assert_equal(repr(pic), "Picture (format: png, path: {0}, modified: False)"
+                     .format(os.path.abspath(self.sample_path)))
+        assert "_image" not in pic.__dict__
+
+        assert_equal(pic[0, 0].rgb, novice.Picture(image=Image.open(self.sample_path)
+                                                   .convert("RGB"))[0, 0].rgb)
+        assert "_image" in pic.__dict__
+        assert_raises(AttributeError, getattr, pic, "_missing")
+
+    def test_memmap(self):
+        pic = novice.open(self.small_sample_path, backing="mmap")
+        assert isinstance(pic._image, np.memmap)
+        assert_equal(pic._image, novice.open(self.small_sample_path)._image)
+        assert_raises(ValueError, novice.open, self.small_sample_path, "disk")
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            raw_path = os.path.join(tmp_dir, "spill.raw")
+            pic = novice.Picture.from_memmap(raw_path, size=(6, 4))
+            assert_equal(pic.size, (6, 4))
+            pic[1:3, 0] = (10, 20, 30)
+            pic.green = 5
+            pic._image.flush()
+            del pic
+
+            pic = novice.Picture.from_memmap(raw_path, size=(6, 4))
+            assert_equal(pic[2, 0].rgb, (10, 5, 30))
+            assert_equal(pic[:2, :]._image.shape, (4, 2, 3))
+
+            npy_path = os.path.join(tmp_dir, "spill.npy")
+            np.save(npy_path, pic._image)
+            pic = novice.Picture.from_memmap(npy_path)
+            assert_equal(pic[2, 0].rgb, (10, 5, 30))
+            assert_raises(ValueError, novice.Picture.from_memmap, raw_path)
+
+            png_path = os.path.join(tmp_dir, "spill.png")
+            pic.save(png_path)
+            assert_equal(novice.open(png_path)._image, pic._image)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_tiled_picture(self):
+        expected = novice.open(self.sample_path)
+        pic = novice.open(self.sample_path, backing="tiled")
+        assert isinstance(pic, novice.TiledPicture)
+        assert_equal(pic.size, expected.size)
+        assert_equal(pic[100:300:3, 7:450]._image, expected[100:300:3, 7:450]._image)
+        assert_equal(pic[17, 400].rgb, expected[17, 400].rgb)
+        assert_equal(np.asarray(pic.red), np.asarray(expected.red))
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            npy_path = os.path.join(tmp_dir, "tiles.npy")
+            expected = expected[:100, :70].copy()
+            np.save(npy_path, expected._image)
+            pic = novice.Picture.from_tiles(npy_path, tile_size=32,
+                                            cache_bytes=4 * 32 * 32 * 3)
+
+            # Only the tiles under the region are read
+            assert_equal(pic[40:50, 60:].size, (10, 10))
+            assert_equal(sorted(pic._image._tiles), [(0, 1)])
+
+            for p in pic:
+                if p.x < 50 and p.y < 40:
+                    p.red = 255 - p.red
+            for p in expected:
+                if p.x < 50 and p.y < 40:
+                    p.red = 255 - p.red
+            pic[60:, 10:20] = expected[60:, 10:20] = "#102030"
+            pic[0, ::2] = expected[0, ::2] = (1, 2, 3)
+            pic.blue = expected.blue = 7
+
+            # Masks only touch the tiles with set pixels
+            mask = np.asarray(expected.red > 128)
+            pic[pic.red > 128] = "red"
+            expected[mask] = "red"
+            mask = np.zeros((70, 100), dtype=bool)
+            mask[5:60:7, 3:90:4] = True
+            colors = np.random.RandomState(0).randint(0, 256, (70, 100, 3))
+            pic[mask] = expected[mask] = colors.astype(np.uint8)
+
+            for row in pic.rows(writable=True):
+                row[::5] = (9, 9, 9)
+            for row in expected.rows(writable=True):
+                row[::5] = (9, 9, 9)
+
+            assert len(pic._image._tiles) <= 4
+            assert_equal(pic._image[:, :], expected._image)
+            assert pic.modified
+
+            pic.flush()
+            assert_equal(np.load(npy_path), expected._image)
+
+            # Copies can be pickled, with all of their pixels
+            copy = pickle.loads(pickle.dumps(pic.copy()))
+            assert_equal(copy._image[:, :], expected._image)
+
+            # Changed tiles are written back on save and once the picture
+            # is no longer used
+            pic[0:5, 0:5] = "red"
+            pic.save(os.path.join(tmp_dir, "saved.png"))
+            assert_equal(np.load(npy_path)[-5:, :5], [[(255, 0, 0)] * 5] * 5)
+            pic[0:5, 0:5] = "blue"
+            del pic
+            assert_equal(np.load(npy_path)[-5:, :5], [[(0, 0, 255)] * 5] * 5)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_batch(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            paths = [self.sample_path, self.small_sample_path, "missing.png"]
+            for workers in (1, 2):
+                out_dir = os.path.join(tmp_dir, str(workers))
+                results = sorted(novice.batch(paths, _blacken_corner,
+                                              workers=workers, out_dir=out_dir))
+                assert_equal([r.path for r in results],
+                             sorted(os.path.abspath(p) for p in paths))
+
+                block, missing, sample = results
+                assert_equal(sample.result, (665, 500))
+                assert_equal(block.error, None)
+                assert isinstance(missing.error, IOError)
+                assert_equal(sorted(os.listdir(out_dir)), ["block.png", "sample.png"])
+
+                saved = novice.open(os.path.join(out_dir, "block.png"))
+                assert_equal(saved[:5, :5]._image, np.zeros((5, 5, 3)))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_pipeline(self):
+        paths = [self.small_sample_path, self.sample_path] * 3
+        sizes = [p.size for p in novice.pipeline(paths, prefetch=1)
+                 .map(_blacken_corner)
+                 .map(lambda p: p.copy())]
+        assert_equal(sizes, [(10, 10), (665, 500)] * 3)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            pattern = os.path.join(tmp_dir, "out", "{index}-{name}.jpg")
+            saved = novice.pipeline(paths[:2]).map(_blacken_corner).save(pattern)
+            assert_equal(saved, [os.path.join(tmp_dir, "out", "0-block.jpg"),
+                                 os.path.join(tmp_dir, "out", "1-sample.jpg")])
+            assert_equal(novice.open(saved[1]).size, (665, 500))
+
+            # The first error stops the pipeline
+            pipe = novice.pipeline(paths + ["missing.png"])
+            assert_raises(IOError, list, pipe.map(_blacken_corner))
+            assert_raises(ZeroDivisionError, list, pipe.map(lambda p: 1 / 0))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_threads(self):
+        expected = novice.open(self.sample_path)
+        expected.size = (301, 187)
+        expected.green = 3
+        smooth = novice.open(self.sample_path)
+        smooth.resize((301, 187), resample="bilinear")
+
+        def box_blur(strip):
+            # Average of each pixel and the pixels above and below it
+            padded = np.concatenate((strip[:1], strip, strip[-1:])).astype(int)
+            return (padded[:-2] + padded[1:-1] + padded[2:]) // 3
+
+        blurred = box_blur(expected._image)
+        try:
+            novice.set_threads(4)
+            pic = novice.open(self.sample_path)
+            pic.size = (301, 187)
+            pic.green = 3
+            assert_equal(pic._image, expected._image)
+
+            rows = np.arange(pic.height)[:, np.newaxis]
+            pic.blue = rows * np.ones(pic.width)
+            assert_equal(pic._image[:, 7, 2], rows.ravel())
+
+            # Threads don't change the results of any filter
+            pic = novice.open(self.sample_path)
+            pic.resize((301, 187), resample="bilinear")
+            assert_equal(pic._image, smooth._image)
+
+            # Neighborhood filters see the rows around their strips
+            image = expected._image.copy()
+            novice._mapstrips(box_blur, image, halo=1)
+            assert_equal(image, blurred)
+        finally:
+            novice.set_threads(1)
+
+        assert_raises(ValueError, novice.set_threads, 0)
+
+    def test_probe(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            cache_path = os.path.join(tmp_dir, "cache", "probe.json")
+            infos = novice.probe_many([self.sample_path, self.small_sample_path],
+                                      cache_path=cache_path)
+            assert_equal(infos[0], (os.path.abspath(self.sample_path),
+                                    (665, 500), "png", "RGB", 1))
+            assert_equal(infos[1].size, (10, 10))
+            assert os.path.exists(cache_path)
+
+            # Unchanged files are answered from the cache
+            gif_path = os.path.join(tmp_dir, "frames.gif")
+            Image.new("RGB", (4, 3)).save(gif_path)
+            info = novice.probe(gif_path, cache_path=cache_path)
+            assert_equal((info.size, info.format, info.frames), ((4, 3), "gif", 1))
+
+            mtime = os.stat(gif_path).st_mtime
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+            cache[gif_path][2] = 400
+            with open(cache_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+            assert_equal(novice.probe(gif_path, cache_path=cache_path).size, (400, 3))
+
+            # Changed files are read again
+            Image.new("RGB", (8, 3)).save(gif_path)
+            os.utime(gif_path, (mtime + 10, mtime + 10))
+            assert_equal(novice.probe(gif_path, cache_path=cache_path).size, (8, 3))
+            assert_equal(novice.probe(gif_path, cache_path=False).size, (8, 3))
+
+            # Entries written by another process in the meantime are kept
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+            cache["/elsewhere.png"] = [0, 0, 1, 1, "png", "RGB", 1]
+            with open(cache_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+            other_path = os.path.join(tmp_dir, "other.png")
+            Image.new("RGB", (2, 2)).save(other_path)
+            novice.probe(other_path, cache_path=cache_path)
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+            assert "/elsewhere.png" in cache
+            assert os.path.abspath(other_path) in cache
+            assert_raises(OSError, novice.probe, "missing.png", cache_path=False)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_open_reduced(self):
+        pic = novice.open(self.sample_path, size=(100, 80))
+        assert_equal(pic.size, (100, 80))
+        assert "_image" not in pic.__dict__
+        assert pic.dirty_region is None
+
+        expected = novice.open(self.sample_path)
+        expected.size = (100, 80)
+        assert_equal(pic._image, expected._image)
+        assert not pic.modified
+
+        assert_equal(novice.open(self.sample_path, max_size=(200, 200)).size,
+                     (200, 150))
+        assert_equal(novice.open(self.sample_path, max_size=(1000, 1000)).size,
+                     (665, 500))
+        assert_raises(ValueError, novice.open, self.sample_path,
+                      size=(10, 10), max_size=(10, 10))
+
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as tmp:
+            novice.open(self.sample_path).save(tmp.name)
+            pic = novice.open(tmp.name, backing="mmap", max_size=(160, 160))
+            assert_equal(pic.size, (160, 120))
+            assert pic.dirty_region is None
+            assert_equal(pic._image.shape, (120, 160, 3))
+            assert_equal(pic.format, "jpeg")
+
+    def test_deferred_geometry(self):
+        expected = novice.open(self.sample_path)
+        expected.size = (300, 200)
+
+        pic = novice.open(self.sample_path)
+        with pic.deferred():
+            pic.width = 300
+            pic.height = 200
+            assert_equal(pic.size, (300, 200))
+            assert "_image" not in pic.__dict__
+        assert pic.modified
+        assert_equal(pic._image, expected._image)
+
+        array = np.arange(10 * 10 * 3, dtype=np.uint8).reshape((10, 10, 3))
+        pic = novice.Picture.from_array(array.copy())
+        with pic.deferred():
+            pic.flip("horizontal")
+            pic.crop(2, 1, 7, 4)
+        assert_equal(pic.size, (5, 3))
+        assert_equal(pic._image, array[:, ::-1][6:9, 2:7])
+
+        pic = novice.Picture.from_array(array.copy())
+        eager = novice.Picture.from_array(array.copy())
+        eager.size = (20, 20)
+        with pic.deferred():
+            pic.size = (20, 20)
+            pic.crop(4, 4, 10, 12)
+        assert_equal(pic._image, eager[4:10, 4:12]._image)
+        assert_equal(pic._image,
+                     np.repeat(np.repeat(array[4:8, 2:5], 2, 0), 2, 1))
+
+        pic.resize((7, 9), resample="bilinear")
+        assert_equal(pic.size, (7, 9))
+        assert_raises(ValueError, pic.resize, (5, 5), resample="fuzzy")
+        assert_raises(ValueError, pic.crop, 0, 0, 8, 9)
+
+        # Failed changes leave the pixels alone
+        image = pic._image.copy()
+        assert_raises(ValueError, setattr, pic, "size", (0, 10))
+        with pic.deferred():
+            pic.size = (3, 3)
+            pic._geometry["box"] = (0.5, 0.0, 20.0, "bad")
+        assert_raises(TypeError, getattr, pic, "_image")
+        assert_equal(pic.size, (7, 9))
+        assert_equal(pic._image, image)
+
+    def test_lazy_import(self):
+        # Importing the package shouldn't import NumPy or PIL
+        code = "import sys, image_novice; print(sorted(set(['numpy', " \
+            "'PIL', 'image_novice.color_table']) & set(sys.modules)))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(novice.__file__)))
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+        assert_equal(output.strip(), "[]")
+
+        # The packed table matches colors.py
+        expected = dict((name.lower().replace("_", " "), getattr(colors, name))
+                        for name in dir(colors) if not name.startswith("__"))
+        assert_equal(dict(novice.color_names), expected)
+        assert "alice blue" in novice.color_names
+        assert "not a color" not in novice.color_names
+
+    def test_nearest_color_name(self):
+        assert_equal(novice.nearest_color_name("alice blue"), "alice blue")
+        assert_equal(novice.nearest_color_name((1, 2, 1)), "black")
+        assert_equal(novice.nearest_color_name((250, 10, 10),
+                                               palette=["black", "red", "blue"]),
+                     "red")
+        assert_raises(ValueError, novice.nearest_color_name, (0, 0, 0),
+                      palette=["not a color"])
+        assert_raises(ValueError, novice.nearest_color_name, (-20, 0, 0))
+        assert_raises(ValueError, novice.nearest_color_name, (300, 0, 0))
+        assert_raises(ValueError, novice._colorindex().nearest, [(0, 256, 0)])
+
+        # Same as comparing with every color
+        names = sorted(novice.color_names)
+        palette = np.array([novice.color_names[n] for n in names])
+        colors = np.random.RandomState(0).randint(0, 256, (2000, 3))
+        distances = ((colors[:, np.newaxis] - palette) ** 2).sum(axis=2)
+        index = novice._colorindex()
+        assert_equal(index.nearest(colors), distances.argmin(axis=1))
+
+        pic = novice.Picture.from_array(colors[:1000].reshape((20, 50, 3)).astype(np.uint8))
+        pic.quantize_to_named_colors()
+        assert pic.modified
+        assert_equal(pic._image.reshape((-1, 3)),
+                     palette[distances[:1000].argmin(axis=1)])
+
+        pic = novice.open(self.sample_path)
+        pic.quantize_to_named_colors(palette=["black", "white"])
+        assert_equal(set(map(tuple, pic._image.reshape((-1, 3)))),
+                     set([(0, 0, 0), (255, 255, 255)]))
+
+    def test_parse_colors(self):
+        colors = novice.parse_colors(["black", "#FF0000", (0, 0, 255),
+                                      [1, 2, 3], np.array([4, 5, 6])])
+        assert_equal(colors.dtype, np.uint8)
+        assert_equal(colors, [(0, 0, 0), (255, 0, 0), (0, 0, 255),
+                              (1, 2, 3), (4, 5, 6)])
+        assert_equal(novice.parse_colors(np.zeros((4, 3))).shape, (4, 3))
+        assert_equal(novice.parse_colors([]).shape, (0, 3))
+        assert_raises(ValueError, novice.parse_colors, [(0, 0, 256)])
+        assert_raises(ValueError, novice.parse_colors, np.zeros((4, 4)))
+        assert_raises(ValueError, novice.parse_colors, ["not a color"])
+
+        # Parsed strings are remembered, up to a limit
+        assert "#FF0000" in novice._color_cache
+        for i in xrange(novice._COLOR_CACHE_SIZE + 10):
+            novice._parse_color("#{0:06X}".format(i))
+        assert len(novice._color_cache) <= novice._COLOR_CACHE_SIZE
+        assert "#FF0000" not in novice._color_cache
+
+        pic = novice.new((2, 2))
+        pic[0, 0] = [10, 20, 30]
+        assert_equal(pic[0, 0].rgb, (10, 20, 30))
+
+    def test_mask_assignment(self):
+        pic = novice.open(self.sample_path)
+        expected = pic._image.copy()
+        mask = pic.red > 128
+        expected[mask.reshape(expected.shape[:2])] = (255, 0, 0)
+        pic[mask] = "red"
+        assert_equal(pic._image, expected)
+        assert pic.modified
+
+        # Whole-picture and per-pixel arrays of colors
+        pic = novice.new((4, 3))
+        colors = np.arange(4 * 3 * 3, dtype=np.uint8).reshape((3, 4, 3))
+        mask = np.zeros((3, 4), dtype=bool)
+        mask[1, 1:3] = True
+        pic[mask] = colors
+        assert_equal(pic._image[mask], colors[mask])
+        assert_equal(pic._image[~mask], 0)
+        pic[mask.ravel()] = np.array([(1, 2, 3), (4, 5, 6)])
+        assert_equal(pic._image[1, 1:3], [(1, 2, 3), (4, 5, 6)])
+        assert_equal(pic.dirty_region, (0, 0, 4, 3))
+
+        # Arrays into slices, laid out like the pixels (top row first)
+        pic[1:3, 0:2] = colors[1:, 1:3]
+        assert_equal(pic._image[1:, 1:3], colors[1:, 1:3])
+        assert_equal(pic[2, 0].rgb, tuple(colors[2, 2]))
+
+        assert_raises(IndexError, pic.__setitem__, np.ones(5, dtype=bool), "red")
+        assert_raises(TypeError, pic.__setitem__, pic.red, "red")
+        assert_raises(ValueError, pic.__setitem__, (0, 0), (0, 0, 300))
+        assert_raises(ValueError, pic.__setitem__, (slice(0, 2), slice(0, 2)),
+                      np.full((2, 2, 3), 300))
+        assert_raises(ValueError, pic.__setitem__, mask, np.full((3, 4, 3), -1.5))
+
+    def test_channel_expressions(self):
+        pic = novice.open(self.sample_path)
+        image = pic._image.astype(np.float64)
+        gray = pic.red * 0.3 + pic.green * 0.59 + pic.blue * 0.11
+        assert isinstance(gray, novice._Expression)
+        assert_equal(gray.shape, (pic.width * pic.height,))
+        assert_allclose(np.asarray(gray), (image[:, :, 0] * 0.3 + image[:, :, 1] * 0.59 +
+                                           image[:, :, 2] * 0.11).ravel())
+
+        # Computed in blocks and saturated instead of wrapped
+        expected = np.clip(image[:, :, 0] + image[:, :, 1], 0, 255)
+        pic.red = pic.red + pic.green
+        assert_equal(pic._image[:, :, 0], expected)
+        pic.blue = 300 - pic.blue * 2
+        assert_equal(pic._image[:, :, 2], np.clip(300 - image[:, :, 2] * 2, 0, 255))
+        pic.green = pic.green / 2
+        assert_equal(pic._image[:, :, 1], image[:, :, 1] // 2)
+
+        # Flat arrays and masks
+        pic.red = np.asarray(pic.green) * 2
+        assert_equal(pic._image[:, :, 0], np.clip(image[:, :, 1] // 2 * 2, 0, 255))
+        pic[pic.blue > 200] = "white"
+        assert (pic._image[pic._image[:, :, 2] > 200] == 255).all()
+        assert_equal(np.asarray(abs(-pic.red)), pic._image[:, :, 0].ravel())
+        assert_equal(pic.red.max(), pic._image[:, :, 0].max())
+
+        # Channels keep the pixels they were made from
+        pic = novice.new((2, 2), color=(10, 20, 30))
+        old = pic.red
+        pic.red = pic.blue
+        pic.blue = old
+        assert_equal(pic[0, 0].rgb, (30, 20, 10))
+        assert_equal(np.asarray(old), [10] * 4)
+
+        # Only the planes of channels in use are copied, and values that
+        # read the channel being set don't need a copy at all
+        data = bytearray(12)
+        pic = novice.Picture.from_buffer(data, (2, 2))
+        image = pic._image
+        green = pic.green
+        pic.red = pic.red + 100
+        pic.green = 50
+        assert pic._image is image
+        assert_equal(data[:3], bytearray([100, 50, 0]))
+        assert_equal(np.asarray(green), [0] * 4)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            npy_path = os.path.join(tmp_dir, "pixels.npy")
+            pic = novice.Picture.from_memmap(npy_path, size=(2, 2))
+            pic.red = pic.red + 100
+            pic._image.flush()
+            assert_equal(np.load(npy_path)[:, :, 0], 100)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        # A color is not a flat array, even for pictures of 3 pixels
+        pic = novice.new((1, 3))
+        pic.rgb = (10, 20, 30)
+        assert_equal(pic._image, [[(10, 20, 30)]] * 3)
+
+    def test_copy_on_write(self):
+        pic = novice.open(self.sample_path)
+        original = pic._image.copy()
+        copy = pic.copy()
+        part = pic[10:20, 30:50]
+        assert np.shares_memory(copy._image, pic._image)
+        assert np.shares_memory(part._image, pic._image)
+
+        # Whichever is changed first gets its own pixels
+        copy[0, 0] = "red"
+        assert not np.shares_memory(copy._image, pic._image)
+        assert_equal(pic._image, original)
+        assert_equal(copy[0, 0].rgb, (255, 0, 0))
+
+        pic.red = 0
+        assert_equal(part._image, original[pic.height - 50:pic.height - 30, 10:20])
+        assert np.shares_memory(copy._image, copy[5:8, 5:8]._image)
+        assert_equal(novice.Picture.__getstate__(part).get("_sharing"), None)
+
+        # Only slices that overlap a change get copies, unless that would
+        # copy more than the picture being changed
+        pic = novice.open(self.sample_path)
+        image = pic._image
+        column = pic[3, :]
+        corner = pic[100:, 100:]
+        pic[3, 0] = "red"
+        assert pic._image is image
+        assert not np.shares_memory(column._image, image)
+        assert np.shares_memory(corner._image, image)
+        assert_equal(column[0, 0].rgb, tuple(original[-1, 3]))
+
+        big = pic[:600, :]
+        big[0, 0] = "blue"
+        assert pic._image is image
+        assert np.shares_memory(corner._image, image)
+        assert not np.shares_memory(big._image, image)
+
+        # Pixels in a buffer or a file are never the ones copied
+        data = bytearray(12)
+        pic = novice.Picture.from_buffer(data, (2, 2))
+        copy = pic.copy()
+        pic[0, 1] = (1, 2, 3)
+        pic[1, 1] = (4, 5, 6)
+        assert_equal(data[:6], bytearray([1, 2, 3, 4, 5, 6]))
+        assert_equal(copy._image, 0)
+
+        # Tiled pictures only copy the tiles that change
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            npy_path = os.path.join(tmp_dir, "tiles.npy")
+            np.save(npy_path, original[:100, :70])
+            pic = novice.Picture.from_tiles(npy_path, tile_size=16,
+                                            cache_bytes=2 * 16 * 16 * 3)
+            copy = pic.copy()
+            copy_of_copy = copy.copy()
+            copy[:10, :10] = "white"
+            copy.flush()
+            assert_equal(copy._image._owned, set([(5, 0), (6, 0)]))
+
+            pic[:, :] = "black"
+            pic.flush()
+            assert_equal(np.load(npy_path), 0)
+
+            expected = original[:100, :70].copy()
+            assert_equal(copy_of_copy._image[:, :], expected)
+            expected[-10:, :10] = 255
+            assert_equal(copy._image[:, :], expected)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_undo(self):
+        pic = novice.open(self.sample_path)
+        assert not pic.undo()
+        original = pic._image.copy()
+
+        pic.checkpoint()
+        pic[:10, :10] = "red"
+        changed = pic._image.copy()
+        assert_equal(len(pic._history["changes"]["tiles"]), 1)
+
+        pic.checkpoint()
+        pic.red = pic.red / 2
+        with pic.deferred():
+            pic.size = (100, 80)
+            pic.flip()
+        assert_equal(pic.size, (100, 80))
+
+        # Back to the last checkpoint, then the one before it
+        assert pic.undo()
+        assert_equal(pic._image, changed)
+        assert pic.undo()
+        assert_equal(pic._image, original)
+        assert not pic.undo()
+
+        assert pic.redo()
+        assert_equal(pic._image, changed)
+        assert pic.redo()
+        assert_equal(pic.size, (100, 80))
+        assert not pic.redo()
+
+        # Changes after undo replace what could be redone
+        pic.undo()
+        pic[0, 0] = "blue"
+        assert not pic.redo()
+        assert pic.undo()
+        assert_equal(pic._image, changed)
+
+    def test_array_interop(self):
+        pic = novice.open(self.sample_path)
+        array = np.asarray(pic)
+        assert np.shares_memory(array, pic._image)
+        assert not array.flags.writeable
+        assert_equal(np.array(pic, dtype=np.float64), pic._image)
+
+        # Arrays keep their memory alive, so they stay valid when the
+        # picture replaces its pixels
+        assert array.base is not pic
+        original = array.copy()
+        pic.size = (10, 10)
+        assert_equal(array, original)
+        part = np.asarray(pic[2:5, 3:7])
+        assert_equal(part, pic._image[3:7, 2:5])
+
+        state = pic.__getstate__()
+        for name in ("_sharing", "_channels", "_exported", "_inflated",
+                     "_display_cache"):
+            assert name not in state
+
+        # Tiled pictures are read through __array__
+        tiled = novice.open(self.sample_path, backing="tiled")
+        assert not hasattr(tiled, "__array_interface__")
+        assert_equal(np.asarray(tiled), novice.open(self.sample_path)._image)
+
+        image = pic.to_pil()
+        assert_equal(image.size, (10, 10))
+        assert_equal(np.asarray(image), pic._image)
+
+        # Buffers are shared; read-only ones are copied on write
+        data = bytearray(range(12))
+        pic = novice.Picture.from_buffer(data, (2, 2))
+        assert_equal(pic[0, 1].rgb, (0, 1, 2))
+        pic[0, 1] = (9, 9, 9)
+        assert_equal(data[:3], bytearray([9, 9, 9]))
+
+        data = bytes(bytearray(range(12)))
+        pic = novice.Picture.from_buffer(data, (2, 2))
+        pic[1, 0] = (7, 7, 7)
+        assert_equal(pic[1, 0].rgb, (7, 7, 7))
+        assert_equal(data, bytes(bytearray(range(12))))
+
+        pil_image = Image.open(self.sample_path).convert("RGB")
+        pic = novice.copy(pil_image)
+        pic[0, 0] = "red"
+        assert_equal(pic[0, 0].rgb, (255, 0, 0))
+
+    def test_load_modes(self):
+        image = Image.open(self.sample_path).convert("RGB")
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            for name, mode in [("rgb.png", "RGB"), ("rgba.png", "RGBA"),
+                               ("gray.png", "L"), ("palette.gif", "P"),
+                               ("bits.png", "1"), ("cmyk.jpg", "CMYK")]:
+                path = os.path.join(tmp_dir, name)
+                image.convert(mode).save(path)
+                expected = np.asarray(Image.open(path).convert("RGB"))
+                for backing in ("memory", "mmap"):
+                    pic = novice.open(path, backing=backing)
+                    assert_equal(pic._image, expected)
+                    assert pic._image.flags.writeable
+        finally:
+            shutil.rmtree(tmp_dir)